@@ -7,6 +7,13 @@ Educational Purpose Only - Do Not Use in Production
 __version__ = "1.0.0"
 __author__ = "LinkedIn Automation"
 
-from .main import LinkedInBot
-
 __all__ = ["LinkedInBot"]
+
+
+def __getattr__(name):
+    # LinkedInBot pulls in Playwright and every feature module, so it is only
+    # imported when first used; loading the config alone stays cheap
+    if name == "LinkedInBot":
+        from .main import LinkedInBot
+        return LinkedInBot
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 Security checkpoint detection for LinkedIn.
 """
 
+import re
 from typing import Tuple, Optional
 from dataclasses import dataclass
 
@@ -26,6 +27,55 @@ SELECTOR_EMAIL_VERIFY = "input#input__email_verification_pin, div[class*='email-
 SELECTOR_SECURITY_CHECK = "div[class*='security-verification'], div[class*='checkpoint']"
 SELECTOR_CHALLENGE = "div[class*='challenge'], main[id*='challenge']"
 
+# (selector, checkpoint type, log message) probed by detect(), in priority order
+CHECKPOINT_CHECKS = (
+    (SELECTOR_2FA_INPUT, CHECKPOINT_2FA, "2FA checkpoint detected"),
+    (SELECTOR_CAPTCHA, CHECKPOINT_CAPTCHA, "CAPTCHA checkpoint detected"),
+    (SELECTOR_PHONE_VERIFY, CHECKPOINT_PHONE_VERIFY, "Phone verification checkpoint detected"),
+    (SELECTOR_EMAIL_VERIFY, CHECKPOINT_EMAIL_VERIFY, "Email verification checkpoint detected"),
+    (SELECTOR_SECURITY_CHECK, CHECKPOINT_SECURITY_CHECK, "Security check checkpoint detected"),
+    (SELECTOR_CHALLENGE, CHECKPOINT_SECURITY_CHECK, "Challenge checkpoint detected"),
+)
+CHECKPOINT_SELECTORS = [selector for selector, _, _ in CHECKPOINT_CHECKS]
+
+# Index of the first selector with a match on the page, or -1
+FIRST_MATCH_SCRIPT = """
+(selectors) => selectors.findIndex((sel) => document.querySelector(sel) !== null)
+"""
+
+# Trimmed text of the first selector whose element has any, or ''
+FIRST_TEXT_SCRIPT = """
+(selectors) => {
+    for (const sel of selectors) {
+        const el = document.querySelector(sel);
+        const text = ((el && el.textContent) || '').trim();
+        if (text) return text;
+    }
+    return '';
+}
+"""
+
+# Elements that may hold a checkpoint's error or instruction text, in priority order
+MESSAGE_SELECTORS = (
+    "div[class*='error'] p",
+    "div[class*='message'] p",
+    "div[class*='instruction'] p",
+    "p[class*='error']",
+    "span[class*='error-message']",
+)
+
+# URL path fragments of LinkedIn's checkpoint pages, matched in a single pass
+CHECKPOINT_URL_PATTERN = re.compile(
+    "|".join(map(re.escape, (
+        "/checkpoint/",
+        "/challenge/",
+        "/security-verification",
+        "/add-phone",
+        "/add-email",
+        "/uas/",
+    )))
+)
+
 
 @dataclass
 class CheckpointInfo:
@@ -47,29 +97,17 @@ class CheckpointDetector:
         """Check for any security checkpoints."""
         logger.debug("Checking for security checkpoints")
         
-        if self.browser.element_exists(SELECTOR_2FA_INPUT):
-            logger.warning("2FA checkpoint detected")
-            return True, CHECKPOINT_2FA
+        # Probe every checkpoint selector in one round-trip
+        try:
+            index = self.browser.page.evaluate(FIRST_MATCH_SCRIPT, CHECKPOINT_SELECTORS)
+        except Exception as e:
+            logger.debug(f"Checkpoint selector probe failed: {e}")
+            index = -1
         
-        if self.browser.element_exists(SELECTOR_CAPTCHA):
-            logger.warning("CAPTCHA checkpoint detected")
-            return True, CHECKPOINT_CAPTCHA
-        
-        if self.browser.element_exists(SELECTOR_PHONE_VERIFY):
-            logger.warning("Phone verification checkpoint detected")
-            return True, CHECKPOINT_PHONE_VERIFY
-        
-        if self.browser.element_exists(SELECTOR_EMAIL_VERIFY):
-            logger.warning("Email verification checkpoint detected")
-            return True, CHECKPOINT_EMAIL_VERIFY
-        
-        if self.browser.element_exists(SELECTOR_SECURITY_CHECK):
-            logger.warning("Security check checkpoint detected")
-            return True, CHECKPOINT_SECURITY_CHECK
-        
-        if self.browser.element_exists(SELECTOR_CHALLENGE):
-            logger.warning("Challenge checkpoint detected")
-            return True, CHECKPOINT_SECURITY_CHECK
+        if index >= 0:
+            _, checkpoint_type, message = CHECKPOINT_CHECKS[index]
+            logger.warning(message)
+            return True, checkpoint_type
         
         current_url = self.browser.get_current_url()
         if self._is_checkpoint_url(current_url):
@@ -88,20 +126,11 @@ class CheckpointDetector:
     
     def get_checkpoint_message(self) -> str:
         """Try to get any error/instruction message from the checkpoint."""
-        message_selectors = [
-            "div[class*='error'] p",
-            "div[class*='message'] p",
-            "div[class*='instruction'] p",
-            "p[class*='error']",
-            "span[class*='error-message']",
-        ]
-        
-        for selector in message_selectors:
-            text = self.browser.get_text(selector)
-            if text:
-                return text.strip()
-        
-        return ""
+        try:
+            return self.browser.page.evaluate(FIRST_TEXT_SCRIPT, list(MESSAGE_SELECTORS))
+        except Exception as e:
+            logger.debug(f"Failed to read checkpoint message: {e}")
+            return ""
     
     def get_checkpoint_info(self) -> Optional[CheckpointInfo]:
         """Get detailed information about the current checkpoint."""
@@ -121,13 +150,4 @@ class CheckpointDetector:
     
     def _is_checkpoint_url(self, url: str) -> bool:
         """Check if the URL indicates a checkpoint."""
-        checkpoint_patterns = [
-            "/checkpoint/",
-            "/challenge/",
-            "/security-verification",
-            "/add-phone",
-            "/add-email",
-            "/uas/",
-        ]
-        
-        return any(pattern in url for pattern in checkpoint_patterns)
+        return CHECKPOINT_URL_PATTERN.search(url) is not None
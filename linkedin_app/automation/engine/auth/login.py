@@ -2,6 +2,7 @@
 LinkedIn login functionality.
 """
 
+import re
 from typing import Optional
 from loguru import logger
 
@@ -18,6 +19,11 @@ PASSWORD_SELECTOR = "#password"
 LOGIN_BUTTON_SELECTOR = "button[type='submit']"
 FEED_PAGE_INDICATOR = "div.feed-identity-module"
 ERROR_MESSAGE_SELECTOR = "#error-for-username, #error-for-password, div.form__label--error"
+# Either feed element means the feed rendered for a logged-in member; one query checks both
+FEED_LOADED_SELECTOR = f"{FEED_PAGE_INDICATOR}, div.feed-shared-update-v2"
+
+# URL paths only reachable while logged in
+LOGGED_IN_URL_PATTERN = re.compile(r"/feed|/mynetwork|/jobs|/messaging|/in/")
 
 
 class Authenticator:
@@ -117,10 +123,8 @@ class Authenticator:
         current_url = self.browser.get_current_url()
         
         # Check if we're on a logged-in page
-        logged_in_paths = ["/feed", "/mynetwork", "/jobs", "/messaging", "/in/"]
-        for path in logged_in_paths:
-            if path in current_url:
-                return True
+        if LOGGED_IN_URL_PATTERN.search(current_url):
+            return True
         
         # Try to navigate to feed and check
         try:
@@ -128,9 +132,7 @@ class Authenticator:
             self.browser.humanizer.random_delay(5000, 10000)
             
             # Check if feed elements are present
-            if self.browser.element_exists(FEED_PAGE_INDICATOR):
-                return True
-            if self.browser.element_exists("div.feed-shared-update-v2"):
+            if self.browser.element_exists(FEED_LOADED_SELECTOR):
                 return True
         except Exception:
             pass
@@ -168,24 +170,24 @@ class Authenticator:
         Returns:
             True if login completed, False if timeout.
         """
-        import time
-        
         logger.info(f"Waiting for manual login completion (timeout: {timeout_seconds}s)")
         
-        start_time = time.time()
-        check_interval = 5  # seconds
-        
-        while time.time() - start_time < timeout_seconds:
-            if self.is_logged_in():
-                logger.info("Manual login detected as complete")
-                
-                # Save session
-                if self.session_manager:
-                    self.session_manager.save_session()
-                
-                return True
-            
-            time.sleep(check_interval)
+        # React to the navigation itself instead of probing on a fixed interval
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        try:
+            self.browser.page.wait_for_url(
+                LOGGED_IN_URL_PATTERN,
+                timeout=timeout_seconds * 1000,
+                wait_until="commit",
+            )
+        except PlaywrightTimeoutError:
+            logger.error(f"Timeout waiting for manual login after {timeout_seconds} seconds")
+            return False
         
-        logger.error(f"Timeout waiting for manual login after {timeout_seconds} seconds")
-        return False
+        logger.info("Manual login detected as complete")
+        
+        # Save session
+        if self.session_manager:
+            self.session_manager.save_session()
+        
+        return True
@@ -37,8 +37,8 @@ class SessionManager:
         logger.info("Saving session cookies")
         
         try:
-            # Get cookies from browser
-            cookies = self.browser.get_cookies()
+            # Read fresh cookies; login may have changed them outside the engine's helpers
+            cookies = self.browser.get_cookies(refresh=True)
             
             # Create session object
             session = Session(
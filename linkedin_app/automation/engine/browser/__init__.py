@@ -2,5 +2,6 @@
 from .browser import BrowserEngine
 from .antidetect import AntiDetect
 from .humanize import Humanizer
+from .workers import iter_browser_workers, run_browser_workers
 
-__all__ = ["BrowserEngine", "AntiDetect", "Humanizer"]
+__all__ = ["BrowserEngine", "AntiDetect", "Humanizer", "iter_browser_workers", "run_browser_workers"]
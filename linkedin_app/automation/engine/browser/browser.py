@@ -2,15 +2,81 @@
 Browser automation engine using Playwright.
 """
 
-from typing import Optional, List, Dict, Any
+from __future__ import annotations
+
+import random
+import re
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Optional, List, Dict, Any, Callable, Iterable, Iterator, Tuple, TYPE_CHECKING
 
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Playwright
 from loguru import logger
 
 from ..utils.config import BrowserConfig
-from .antidetect import AntiDetect
+from .antidetect import AntiDetect, LAUNCH_ARGS
 from .humanize import Humanizer
 
+if TYPE_CHECKING:
+    # Playwright itself is imported when the browser is started
+    from playwright.sync_api import (
+        APIRequestContext, APIResponse, Browser, BrowserContext, Page, Playwright, Route,
+    )
+
+
+# Attribute of the first matched element, or null when nothing matched
+FIRST_ATTRIBUTE_SCRIPT = "(elements, name) => elements.length ? elements[0].getAttribute(name) : null"
+
+# In-page scripts are passed to evaluate on every call rather than installed once as
+# window globals (init script / expose_binding) and called by name: evaluate runs in
+# the page's main world, so any helper left on window is visible to LinkedIn's own
+# scripts and would fingerprint the session. V8 caches compiled code for repeated
+# identical sources, so resending the text costs little beyond its bytes.
+
+# Reads {key: [selector, attribute|null]} in one pass: the first match's attribute, or its
+# textContent when attribute is null; null when nothing matches or the selector is not plain CSS
+BATCH_EXTRACT_SCRIPT = """
+(spec) => {
+    const out = {};
+    for (const [key, [selector, attribute]] of Object.entries(spec)) {
+        let el = null;
+        try { el = document.querySelector(selector); } catch (e) {}
+        out[key] = el ? (attribute ? el.getAttribute(attribute) : el.textContent) : null;
+    }
+    return out;
+}
+"""
+
+# Pages map_urls keeps loading at once by default
+PAGE_POOL_SIZE = 3
+
+# Navigations are spaced at least this far apart (random per navigation, seconds);
+# time already spent on the previous page counts towards the gap
+NAVIGATION_GAP_SECONDS = (5.0, 15.0)
+# Longest navigate() waits for the network to go quiet; LinkedIn keeps some
+# connections open, so networkidle is a best-effort signal
+NETWORK_IDLE_TIMEOUT_MS = 10000
+# Smooth-scrolls by dy and resolves on scrollend, or after maxMs when the page
+# cannot scroll that far (no scrollend fires) or the browser lacks the event
+SMOOTH_SCROLL_SCRIPT = """
+({dy, maxMs}) => new Promise((resolve) => {
+    const done = () => { window.removeEventListener('scrollend', done); resolve(); };
+    window.addEventListener('scrollend', done, {once: true});
+    window.scrollBy({top: dy, behavior: 'smooth'});
+    setTimeout(done, maxMs);
+})
+"""
+# Upper bound on the smooth-scroll animation
+SCROLL_END_TIMEOUT_MS = 1500
+# Longest scroll() waits for lazily loaded content to settle
+SCROLL_SETTLE_TIMEOUT_MS = 2000
+# True once the document has loaded and no region is marked busy
+PAGE_SETTLED_SCRIPT = "() => document.readyState === 'complete' && !document.querySelector('[aria-busy=\"true\"]')"
+
+
+# Neither holds per-engine state, so every engine (and worker thread) shares one of each
+_SHARED_ANTIDETECT = AntiDetect()
+_SHARED_HUMANIZER = Humanizer()
+
 
 class BrowserEngine:
     """
@@ -23,49 +89,88 @@ class BrowserEngine:
         self._browser: Optional[Browser] = None
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
-        self.humanizer = Humanizer()
-        self.antidetect = AntiDetect()
+        # False when attached over CDP to a context that belongs to the running browser
+        self._owns_context = True
+        # Idle extra pages in the same context, reused by acquire_page()
+        self._page_pool: List[Page] = []
+        # monotonic() time of the last navigate(), used to space navigations
+        self._last_nav_ts: Optional[float] = None
+        # Last cookies read from the context; dropped by anything likely to change them
+        self._cookie_cache: Optional[List[Dict[str, Any]]] = None
+        # Clicks, typing and navigations on the main page since it was opened
+        self._actions_since_recycle = 0
+        # Bumped whenever the main page is replaced; see page_generation
+        self._page_generation = 0
+        # Subresources aborted by _route_handler, compiled once for the per-request check
+        self._blocked_types = frozenset(config.block_resource_types)
+        self._blocked_url_re = (
+            re.compile("|".join(f"(?:{p})" for p in config.blocked_url_patterns))
+            if config.blocked_url_patterns else None
+        )
+        self.humanizer = _SHARED_HUMANIZER
+        self.antidetect = _SHARED_ANTIDETECT
         
     def start(self) -> None:
         """Start the browser."""
         logger.info("Starting browser engine (Sync)")
         
+        from playwright.sync_api import sync_playwright
         self._playwright = sync_playwright().start()
         
-        # Launch browser with anti-detection settings
-        launch_args = self.antidetect.get_launch_args()
-        
-        self._browser = self._playwright.chromium.launch(
-            headless=self.config.headless,
-            args=launch_args,
-        )
-        
-        # Create context with fingerprint protection
-        self._context = self._browser.new_context(
-            viewport={
+        context_options = {
+            "viewport": {
                 "width": self.config.viewport_width,
                 "height": self.config.viewport_height,
             },
-            user_agent=self.config.user_agent,
-            locale="en-US",
-            timezone_id="America/New_York",
-        )
+            "user_agent": self.config.user_agent,
+            "locale": "en-US",
+            "timezone_id": "America/New_York",
+        }
+        
+        if self.config.cdp_endpoint:
+            # Attach to a long-lived Chrome and reuse its profile (and so its session)
+            logger.info(f"Connecting to running browser at {self.config.cdp_endpoint}")
+            self._browser = self._playwright.chromium.connect_over_cdp(self.config.cdp_endpoint)
+            if self._browser.contexts:
+                self._context = self._browser.contexts[0]
+                self._owns_context = False
+            else:
+                self._context = self._browser.new_context(**context_options)
+        else:
+            # Launch browser with anti-detection settings
+            self._browser = self._playwright.chromium.launch(
+                headless=self.config.headless,
+                args=list(LAUNCH_ARGS),
+            )
+            
+            # Create context with fingerprint protection
+            self._context = self._browser.new_context(**context_options)
+        
+        # Anti-detection scripts on the context cover every page it opens
+        self.antidetect.apply_stealth(self._context)
+        
+        # Skip downloading blocked subresources on every page of the context.
+        # Routing disables the HTTP cache, so only install it when something is blocked
+        if self._blocked_types or self._blocked_url_re:
+            self._context.route("**/*", self._route_handler)
         
         # Create page
         self._page = self._context.new_page()
         
-        # Apply anti-detection scripts
-        self.antidetect.apply_stealth(self._page)
-        
         logger.info("Browser engine started successfully")
     
     def stop(self) -> None:
         """Stop the browser and cleanup."""
         logger.info("Stopping browser engine")
         
+        for page in self._page_pool:
+            page.close()
+        self._page_pool = []
         if self._page:
             self._page.close()
-        if self._context:
+        # A reused CDP context stays open for the next run; closing the browser
+        # then only disconnects from it
+        if self._context and self._owns_context:
             self._context.close()
         if self._browser:
             self._browser.close()
@@ -74,6 +179,40 @@ class BrowserEngine:
             
         logger.info("Browser engine stopped")
     
+    def _count_action(self) -> bool:
+        """Count an action on the main page; True once it is due for recycling."""
+        self._actions_since_recycle += 1
+        limit = self.config.max_actions_per_page
+        return bool(limit) and self._actions_since_recycle >= limit
+    
+    def _recycle_page(self) -> None:
+        """
+        Replace the main page with a fresh one from the same context.
+        
+        Long sessions accumulate detached DOM nodes and JS heap that slow down
+        every later call; a new page starts clean while cookies, routes and
+        init scripts stay on the context.
+        """
+        logger.info(f"Recycling page after {self._actions_since_recycle} actions")
+        old_page = self._page
+        self._page = self.context.new_page()
+        self._actions_since_recycle = 0
+        self._page_generation += 1
+        try:
+            old_page.close()
+        except Exception as e:
+            logger.debug(f"Failed to close recycled page: {e}")
+    
+    def _route_handler(self, route: Route) -> None:
+        """Abort blocked resource types and URLs, let everything else through."""
+        request = route.request
+        if request.resource_type in self._blocked_types or (
+            self._blocked_url_re and self._blocked_url_re.search(request.url)
+        ):
+            route.abort()
+        else:
+            route.continue_()
+    
     @property
     def page(self) -> Page:
         """Get the current page."""
@@ -81,6 +220,16 @@ class BrowserEngine:
             raise RuntimeError("Browser not started. Call start() first.")
         return self._page
     
+    @property
+    def page_generation(self) -> int:
+        """
+        Version of the main page, bumped each time it is recycled.
+        
+        Callers that keep objects built from page (e.g. locators) should
+        remember the generation they were built at and rebuild when it changes.
+        """
+        return self._page_generation
+    
     @property
     def context(self) -> BrowserContext:
         """Get the browser context."""
@@ -88,65 +237,159 @@ class BrowserEngine:
             raise RuntimeError("Browser not started. Call start() first.")
         return self._context
     
-    def navigate(self, url: str) -> None:
+    @contextmanager
+    def acquire_page(self) -> Iterator[Page]:
+        """
+        Borrow an extra page sharing this context's session.
+        
+        Pages are opened on demand (the context's stealth scripts already cover
+        them) and go back to the pool on exit, so repeated crawls do not reopen them.
+        """
+        if self._page_pool:
+            page = self._page_pool.pop()
+        else:
+            page = self.context.new_page()
+        try:
+            yield page
+        finally:
+            self.release_page(page)
+    
+    def release_page(self, page: Page) -> None:
+        """Return a borrowed page to the pool, dropping it if it was closed."""
+        if not page.is_closed():
+            self._page_pool.append(page)
+    
+    def map_urls(
+        self,
+        urls: Iterable[str],
+        fn: Callable[[Page, str], Any],
+        pool_size: int = PAGE_POOL_SIZE,
+    ) -> List[Any]:
+        """
+        Load URLs on several pages at once and call fn(page, url) on each.
+        
+        The sync API is bound to this thread, so fn runs page by page, but each
+        group of pool_size navigations is started before any is waited on and
+        the pages load side by side in the browser. Results come back in URL
+        order; a URL whose load or fn fails yields None.
+        """
+        urls = list(urls)
+        results = []
+        for start in range(0, len(urls), pool_size):
+            group = urls[start:start + pool_size]
+            with ExitStack() as stack:
+                pages = [stack.enter_context(self.acquire_page()) for _ in group]
+                
+                # Only wait for the response to commit so the next navigation starts right away
+                started = []
+                for page, url in zip(pages, group):
+                    logger.info(f"Navigating to {url}")
+                    self.humanizer.random_delay(1000, 3000)
+                    try:
+                        page.goto(url, wait_until="commit")
+                        started.append(True)
+                    except Exception as e:
+                        logger.error(f"Failed to navigate to {url}: {e}")
+                        started.append(False)
+                
+                self._cookie_cache = None
+                for page, url, ok in zip(pages, group, started):
+                    if not ok:
+                        results.append(None)
+                        continue
+                    try:
+                        page.wait_for_load_state("domcontentloaded")
+                        results.append(fn(page, url))
+                    except Exception as e:
+                        logger.error(f"Failed to process {url}: {e}")
+                        results.append(None)
+        return results
+    
+    def navigate(self, url: str, page: Optional[Page] = None) -> None:
         """Navigate to a URL with human-like behavior."""
         logger.info(f"Navigating to {url}")
+        if page is None:
+            # The current document is about to be replaced anyway, so this is
+            # the one point where swapping the page loses no state
+            if self._count_action():
+                self._recycle_page()
+            page = self.page
         
-        # Random delay before navigation
-        self.humanizer.random_delay(5000, 15000)
+        # Keep navigations a human-looking gap apart, only sleeping for what is left of it
+        if self._last_nav_ts is not None:
+            remaining = random.uniform(*NAVIGATION_GAP_SECONDS) - (time.monotonic() - self._last_nav_ts)
+            if remaining > 0:
+                time.sleep(remaining)
         
-        self.page.goto(url, wait_until="domcontentloaded")
+        page.goto(url, wait_until="domcontentloaded")
+        self._last_nav_ts = time.monotonic()
+        self._cookie_cache = None
         
-        # Wait for page to stabilize
-        self.humanizer.random_delay(5000, 10000)
+        # Wait for the page to stabilize, but no longer than it actually takes
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        try:
+            page.wait_for_load_state("networkidle", timeout=NETWORK_IDLE_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            logger.debug(f"Network not idle after {NETWORK_IDLE_TIMEOUT_MS}ms, continuing")
+        self.humanizer.random_delay(500, 1500)
         
     def click(self, selector: str, timeout: int = 10000) -> None:
         """Click an element with human-like behavior."""
         logger.debug(f"Clicking element: {selector}")
         
-        # Wait for element
-        self.page.wait_for_selector(selector, timeout=timeout)
+        self._count_action()
         
-        # Human-like delay before click
-        self.humanizer.random_delay(200, 500)
+        # One locator for position and click instead of resolving the selector per step
+        element = self.page.locator(selector).first
         
-        # Get element position for human-like mouse movement
-        element = self.page.query_selector(selector)
-        if element:
-            box = element.bounding_box()
-            if box:
-                # Move mouse to element with human-like path
-                target_x = box["x"] + box["width"] / 2
-                target_y = box["y"] + box["height"] / 2
-                self.humanizer.human_mouse_move(self.page, target_x, target_y)
+        # Get element position for human-like mouse movement. This waits for the
+        # element itself, so no separate wait; the pre-click delay runs from
+        # before this call, so the round-trip is not added to it
+        started = time.monotonic()
+        box = element.bounding_box(timeout=timeout)
+        self.humanizer.remaining_delay(200, 500, started)
+        if box:
+            # Move mouse to element with human-like path
+            target_x = box["x"] + box["width"] / 2
+            target_y = box["y"] + box["height"] / 2
+            self.humanizer.human_mouse_move(self.page, target_x, target_y)
         
-        self.page.click(selector)
+        # Auto-waits for the element to be visible, stable and enabled
+        element.click(timeout=timeout)
+        self._cookie_cache = None
         
     def type_text(self, selector: str, text: str, human_like: bool = True) -> None:
         """Type text with human-like speed."""
         logger.debug(f"Typing text in: {selector}")
         
-        self.page.wait_for_selector(selector)
-        self.page.focus(selector)
+        self._count_action()
         
-        # Clear existing content
-        self.page.fill(selector, "")
+        # One locator for the whole interaction instead of a selector lookup per call
+        field = self.page.locator(selector).first
+        
+        # Clear existing content (fill waits for the field to be editable and focuses it)
+        field.fill("")
         
         if human_like:
-            # Type character by character with random delays
-            for char in text:
-                self.page.type(selector, char, delay=self.humanizer.typing_delay())
+            # Playwright sends the keystrokes one by one at this cadence in a single call
+            field.press_sequentially(text, delay=self.humanizer.typing_delay())
         else:
-            self.page.fill(selector, text)
+            field.fill(text)
     
     def scroll(self, direction: str = "down", amount: int = 300) -> None:
         """Scroll the page with human-like behavior."""
         scroll_y = amount if direction == "down" else -amount
         
-        self.page.evaluate(f"window.scrollBy({{top: {scroll_y}, behavior: 'smooth'}})")
+        # Returns once the smooth scroll has actually finished
+        self.page.evaluate(SMOOTH_SCROLL_SCRIPT, {"dy": scroll_y, "maxMs": SCROLL_END_TIMEOUT_MS})
         
-        # Wait after scrolling
-        self.humanizer.random_delay(5000, 10000)
+        # Wait for any content the scroll triggered to settle, plus a short jitter
+        self.humanizer.random_delay(100, 300)
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        try:
+            self.page.wait_for_function(PAGE_SETTLED_SCRIPT, timeout=SCROLL_SETTLE_TIMEOUT_MS)
+        except PlaywrightTimeoutError:
+            pass
     
     def wait_for_element(self, selector: str, timeout: int = 10000) -> bool:
         """Wait for an element to be visible."""
@@ -156,34 +399,111 @@ class BrowserEngine:
         except Exception:
             return False
     
-    def element_exists(self, selector: str) -> bool:
+    def element_exists(self, selector: str, page: Optional[Page] = None) -> bool:
         """Check if an element exists on the page."""
         try:
-            element = self.page.query_selector(selector)
-            return element is not None
+            return (page or self.page).locator(selector).count() > 0
         except Exception:
             return False
     
-    def get_text(self, selector: str) -> str:
+    def get_text(self, selector: str, page: Optional[Page] = None) -> str:
         """Get text content of an element."""
         try:
-            element = self.page.query_selector(selector)
-            if element:
-                return element.text_content() or ""
+            # Reads the first match without waiting for one to appear, in a single call
+            texts = (page or self.page).locator(selector).first.all_text_contents()
+            if texts:
+                return texts[0] or ""
         except Exception:
             pass
         return ""
     
-    def get_attribute(self, selector: str, attribute: str) -> Optional[str]:
+    def get_attribute(self, selector: str, attribute: str, page: Optional[Page] = None) -> Optional[str]:
         """Get an attribute value from an element."""
         try:
-            element = self.page.query_selector(selector)
-            if element:
-                return element.get_attribute(attribute)
+            # evaluate_all does not wait for a match, unlike Locator.get_attribute
+            return (page or self.page).locator(selector).first.evaluate_all(FIRST_ATTRIBUTE_SCRIPT, attribute)
         except Exception:
             pass
         return None
     
+    def batch_extract(
+        self,
+        spec: Dict[str, Tuple[str, Optional[str]]],
+        page: Optional[Page] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Read several fields in a single round-trip.
+        
+        spec maps a key to (selector, attribute); attribute None reads the text
+        content. Selectors run through document.querySelector, so Playwright-only
+        syntax such as :has-text() is not supported here; use get_text for those.
+        Keys whose selector matches nothing come back as None.
+        """
+        try:
+            return (page or self.page).evaluate(BATCH_EXTRACT_SCRIPT, spec)
+        except Exception as e:
+            logger.debug(f"Batch extract failed: {e}")
+            return dict.fromkeys(spec)
+    
+    @property
+    def api(self) -> APIRequestContext:
+        """
+        Request client of the browser context.
+        
+        It shares the context's cookie jar and keeps connections alive between
+        calls, so JSON/XHR endpoints can be read without rendering a page.
+        """
+        return self.context.request
+    
+    def api_get(self, url: str, **kwargs) -> APIResponse:
+        """GET through the context's request client (see api)."""
+        return self.api.get(url, headers=self._api_headers(url, kwargs.pop("headers", None)), **kwargs)
+    
+    def api_post(self, url: str, **kwargs) -> APIResponse:
+        """POST through the context's request client (see api)."""
+        return self.api.post(url, headers=self._api_headers(url, kwargs.pop("headers", None)), **kwargs)
+    
+    def _api_headers(self, url: str, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """
+        Add the csrf-token LinkedIn's API expects for LinkedIn URLs.
+        
+        The token is the session's JSESSIONID cookie, read from the cookie snapshot.
+        """
+        headers = dict(headers or {})
+        if "linkedin.com" in url and "csrf-token" not in headers:
+            for cookie in self.get_cookies():
+                if cookie.get("name") == "JSESSIONID":
+                    headers["csrf-token"] = cookie.get("value", "").strip('"')
+                    break
+        return headers
+    
+    def fetch(self, url: str, *, render: bool = False, expect: Optional[str] = None) -> str:
+        """
+        Get a URL's HTML or JSON, skipping the browser when the raw response will do.
+        
+        Unless render is set, the URL is requested with api_get, which sends
+        the session's cookies without loading, executing or laying out the
+        page. The page is rendered in the browser instead (and page.content()
+        returned) when render is set, when the request fails or is not 2xx,
+        or when expect is given and missing from the raw response, i.e. the
+        content is only built by JavaScript.
+        """
+        if not render:
+            try:
+                response = self.api_get(url)
+                if response.ok:
+                    body = response.text()
+                    if expect is None or expect in body:
+                        return body
+                    logger.debug(f"{url} needs rendering: {expect!r} not in raw response")
+                else:
+                    logger.debug(f"Direct fetch of {url} returned {response.status}, rendering instead")
+            except Exception as e:
+                logger.debug(f"Direct fetch of {url} failed, rendering instead: {e}")
+        
+        self.navigate(url)
+        return self.page.content()
+    
     def get_all_elements(self, selector: str) -> List[Any]:
         """Get all elements matching a selector."""
         return self.page.query_selector_all(selector)
@@ -192,23 +512,51 @@ class BrowserEngine:
         """Get the current page URL."""
         return self.page.url
     
-    def screenshot(self, path: str) -> None:
-        """Take a screenshot of the current page."""
-        self.page.screenshot(path=path, full_page=True)
+    def screenshot(
+        self,
+        path: str,
+        *,
+        full_page: bool = False,
+        clip: Optional[Dict[str, float]] = None,
+        quality: int = 80,
+        image_type: str = "jpeg",
+    ) -> None:
+        """
+        Take a screenshot of the current page.
+        
+        Defaults to a JPEG of the visible viewport, which encodes much faster
+        than a full-page PNG. clip ({x, y, width, height}) limits it to a region.
+        """
+        self.page.screenshot(
+            path=path,
+            full_page=full_page,
+            clip=clip,
+            type=image_type,
+            quality=quality if image_type == "jpeg" else None,
+        )
         logger.info(f"Screenshot saved to {path}")
     
-    def get_cookies(self) -> List[Dict[str, Any]]:
-        """Get all cookies from the browser context."""
-        return self._context.cookies()
+    def get_cookies(self, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get all cookies from the browser context.
+        
+        The result is reused until a navigation, click or cookie change made
+        through this engine. Pass refresh=True after driving the page directly.
+        """
+        if refresh or self._cookie_cache is None:
+            self._cookie_cache = self._context.cookies()
+        return list(self._cookie_cache)
     
     def set_cookies(self, cookies: List[Dict[str, Any]]) -> None:
         """Set cookies in the browser context."""
         self._context.add_cookies(cookies)
+        self._cookie_cache = None
     
     def clear_cookies(self) -> None:
         """Clear all cookies from the browser context."""
         self._context.clear_cookies()
+        self._cookie_cache = None
     
-    def evaluate(self, script: str) -> Any:
+    def evaluate(self, script: str, page: Optional[Page] = None) -> Any:
         """Evaluate JavaScript in the page context."""
-        return self.page.evaluate(script)
+        return (page or self.page).evaluate(script)
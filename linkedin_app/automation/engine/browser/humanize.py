@@ -5,9 +5,41 @@ Human-like behavior patterns for browser automation.
 import time
 import random
 import math
-from typing import List, Tuple
+from typing import List, Tuple, TYPE_CHECKING
 
-from playwright.sync_api import Page
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+
+# QWERTY neighbours used to simulate typing mistakes
+ADJACENT_KEYS = {
+    'a': ['s', 'q', 'z'],
+    'b': ['v', 'g', 'n'],
+    'c': ['x', 'd', 'v'],
+    'd': ['s', 'e', 'f', 'c'],
+    'e': ['w', 'r', 'd'],
+    'f': ['d', 'r', 'g', 'v'],
+    'g': ['f', 't', 'h', 'b'],
+    'h': ['g', 'y', 'j', 'n'],
+    'i': ['u', 'o', 'k'],
+    'j': ['h', 'u', 'k', 'm'],
+    'k': ['j', 'i', 'l'],
+    'l': ['k', 'o', 'p'],
+    'm': ['n', 'j', 'k'],
+    'n': ['b', 'h', 'm'],
+    'o': ['i', 'p', 'l'],
+    'p': ['o', 'l'],
+    'q': ['w', 'a'],
+    'r': ['e', 't', 'f'],
+    's': ['a', 'w', 'd', 'x'],
+    't': ['r', 'y', 'g'],
+    'u': ['y', 'i', 'j'],
+    'v': ['c', 'f', 'b'],
+    'w': ['q', 'e', 's'],
+    'x': ['z', 's', 'c'],
+    'y': ['t', 'u', 'h'],
+    'z': ['a', 'x'],
+}
 
 
 class Humanizer:
@@ -24,32 +56,41 @@ class Humanizer:
         delay = random.randint(min_ms, max_ms)
         time.sleep(delay / 1000)
     
+    def remaining_delay(self, min_ms: int, max_ms: int, started: float) -> None:
+        """
+        Wait until a random duration between min and max milliseconds has
+        passed since started (a time.monotonic() value), so work done in the
+        meantime counts towards the delay.
+        """
+        delay = random.randint(min_ms, max_ms) / 1000
+        remaining = delay - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+    
     def typing_delay(self) -> int:
         """Get a human-like typing delay in milliseconds."""
         # Average human types 40-60 WPM, roughly 100-200ms per character
         return random.randint(50, 150)
     
-    def human_mouse_move(self, page: Page, target_x: float, target_y: float) -> None:
+    def human_mouse_move(self, page: "Page", target_x: float, target_y: float) -> None:
         """
         Move mouse to target position with human-like movement.
         Uses bezier curves for natural-looking paths.
         """
-        # Get current mouse position (start from center if not available)
-        try:
-            current_pos = page.evaluate("""
-                () => {
-                    return {x: window.innerWidth / 2, y: window.innerHeight / 2};
-                }
-            """)
-            start_x = current_pos.get("x", 960)
-            start_y = current_pos.get("y", 540)
-        except Exception:
+        # Start from the viewport center. viewport_size is known client-side, so
+        # this costs no round-trip (unlike reading window size via evaluate)
+        viewport = page.viewport_size
+        if viewport:
+            start_x, start_y = viewport["width"] / 2, viewport["height"] / 2
+        else:
             start_x, start_y = 960, 540
         
         # Generate bezier curve path
         path = self._generate_bezier_path(start_x, start_y, target_x, target_y)
         
-        # Move along the path
+        # Move along the path. Each point goes through Input.dispatchMouseEvent so the
+        # browser sees trusted events; dispatching mousemove from page JS would be
+        # cheaper but produces isTrusted=false events, which is itself a bot signal
         for point in path:
             page.mouse.move(point[0], point[1])
             time.sleep(random.randint(5, 15) / 1000)
@@ -83,7 +124,7 @@ class Humanizer:
         
         return path
     
-    def human_scroll(self, page: Page, direction: str = "down") -> None:
+    def human_scroll(self, page: "Page", direction: str = "down") -> None:
         """Scroll with human-like behavior."""
         # Random scroll amount
         amount = random.randint(200, 500)
@@ -154,38 +195,9 @@ class Humanizer:
         Returns:
             An adjacent key that could be a typo.
         """
-        adjacent_keys = {
-            'a': ['s', 'q', 'z'],
-            'b': ['v', 'g', 'n'],
-            'c': ['x', 'd', 'v'],
-            'd': ['s', 'e', 'f', 'c'],
-            'e': ['w', 'r', 'd'],
-            'f': ['d', 'r', 'g', 'v'],
-            'g': ['f', 't', 'h', 'b'],
-            'h': ['g', 'y', 'j', 'n'],
-            'i': ['u', 'o', 'k'],
-            'j': ['h', 'u', 'k', 'm'],
-            'k': ['j', 'i', 'l'],
-            'l': ['k', 'o', 'p'],
-            'm': ['n', 'j', 'k'],
-            'n': ['b', 'h', 'm'],
-            'o': ['i', 'p', 'l'],
-            'p': ['o', 'l'],
-            'q': ['w', 'a'],
-            'r': ['e', 't', 'f'],
-            's': ['a', 'w', 'd', 'x'],
-            't': ['r', 'y', 'g'],
-            'u': ['y', 'i', 'j'],
-            'v': ['c', 'f', 'b'],
-            'w': ['q', 'e', 's'],
-            'x': ['z', 's', 'c'],
-            'y': ['t', 'u', 'h'],
-            'z': ['a', 'x'],
-        }
-        
         char_lower = char.lower()
-        if char_lower in adjacent_keys:
-            mistake = random.choice(adjacent_keys[char_lower])
+        if char_lower in ADJACENT_KEYS:
+            mistake = random.choice(ADJACENT_KEYS[char_lower])
             return mistake.upper() if char.isupper() else mistake
         return char
     
@@ -0,0 +1,88 @@
+"""
+Parallel browser workers sharing one logged-in session.
+"""
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from loguru import logger
+
+from .browser import BrowserEngine
+
+
+# Put on the results queue by each worker when it has drained the work queue
+_WORKER_DONE = object()
+
+
+def iter_browser_workers(
+    browser: BrowserEngine,
+    items: Iterable[Any],
+    workers: int,
+    handler: Callable[[BrowserEngine, Any], Any],
+    on_exit: Optional[Callable[[], None]] = None,
+) -> Iterator[Any]:
+    """
+    Process items with several browsers running side by side, yielding
+    handler(worker_browser, item) results in the order they complete.
+
+    Playwright's sync API is bound to the thread that started it, so each
+    worker thread launches its own browser, seeded with the cookies of the
+    given browser, and drains a shared queue. Results are handed back
+    through a completion queue, so the caller can act on the first ones
+    while slower items are still loading. on_exit runs in each worker
+    thread once it is done (e.g. to release thread-bound DB connections).
+    """
+    cookies = browser.get_cookies()
+    work = queue.Queue()
+    for item in items:
+        work.put(item)
+    results = queue.Queue()
+
+    def drain() -> None:
+        worker_browser = BrowserEngine(browser.config)
+        try:
+            worker_browser.start()
+            worker_browser.set_cookies(cookies)
+            while True:
+                try:
+                    item = work.get_nowait()
+                except queue.Empty:
+                    return
+                results.put(handler(worker_browser, item))
+        finally:
+            results.put(_WORKER_DONE)
+            worker_browser.stop()
+            if on_exit:
+                on_exit()
+
+    logger.info(f"Starting {workers} parallel browser workers")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(drain) for _ in range(workers)]
+        finished = 0
+        while finished < workers:
+            result = results.get()
+            if result is _WORKER_DONE:
+                finished += 1
+                continue
+            yield result
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Browser worker failed: {e}")
+
+
+def run_browser_workers(
+    browser: BrowserEngine,
+    items: Iterable[Any],
+    workers: int,
+    handler: Callable[[BrowserEngine, Any], None],
+    on_exit: Optional[Callable[[], None]] = None,
+) -> None:
+    """
+    Process items with several browsers running side by side, calling
+    handler(worker_browser, item) for each; see iter_browser_workers.
+    """
+    for _ in iter_browser_workers(browser, items, workers, handler, on_exit):
+        pass
@@ -59,6 +59,16 @@ class ConnectionManager:
         self.daily_limit = daily_limit
         self.database_manager = database_manager
     
+    def with_browser(self, browser: BrowserEngine) -> "ConnectionManager":
+        """Return a manager sharing this one's tracker and settings but driving another browser."""
+        return ConnectionManager(
+            browser,
+            self.tracker,
+            self.note_composer,
+            self.daily_limit,
+            database_manager=self.database_manager,
+        )
+    
     def send_connection_request(
         self,
         profile: Profile,
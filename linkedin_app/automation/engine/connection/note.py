@@ -10,6 +10,15 @@ from loguru import logger
 from ..utils.models import Profile
 
 
+# Substituted for template variables the profile has no value for
+NOTE_FALLBACKS = {
+    "first_name": "there",
+    "company": "your company",
+    "title": "your work",
+    "location": "your area",
+}
+
+
 class NoteComposer:
     """
     Composes personalized notes for connection requests.
@@ -71,13 +80,7 @@ class NoteComposer:
     
     def _get_fallback(self, key: str) -> str:
         """Get fallback value for an empty variable."""
-        fallbacks = {
-            "first_name": "there",
-            "company": "your company",
-            "title": "your work",
-            "location": "your area",
-        }
-        return fallbacks.get(key, "")
+        return NOTE_FALLBACKS.get(key, "")
     
     def _clean_note(self, note: str) -> str:
         """Clean up the note text."""
@@ -25,6 +25,14 @@ MODAL_CANCEL_BUTTON = "button.connect-cta-form__cancel"
 MODAL_MESSAGE_TEXTAREA = "textarea#connect-cta-form__invitation"
 MODAL_ADD_NOTE_BUTTON = "button:has-text('Add a note')"
 MODAL_EMAIL_REQUIRED_FIELD = "input#connect-cta-form__email"
+CONNECT_MODAL = "div.artdeco-modal"
+
+# Connect option candidates in the 3-dots dropdown, in priority order
+CONNECT_OPTION_SELECTORS = (
+    CONNECT_OPTION,
+    "div.artdeco-dropdown__item:has-text('Connect')",
+    "li:has-text('Connect')",
+)
 
 # Pagination
 NEXT_PAGE_BUTTON = "button.search-results__pagination-next-button"
@@ -45,6 +53,21 @@ class SalesNavConnectionManager:
         self.tracker = tracker
         self.database_manager = database_manager
         self.parser = SalesNavParser(browser)
+        # Page generation the locators were built for; None until first use
+        self._locators_generation: Optional[int] = None
+    
+    def _bind_locators(self) -> None:
+        """Create the page-level locators used by the connect flow, again whenever the page was recycled."""
+        if self._locators_generation == self.browser.page_generation:
+            return
+        page = self.browser.page
+        self._connect_options = [page.locator(sel).first for sel in CONNECT_OPTION_SELECTORS]
+        self._email_field = page.locator(MODAL_EMAIL_REQUIRED_FIELD)
+        self._cancel_button = page.locator(MODAL_CANCEL_BUTTON)
+        self._message_textarea = page.locator(MODAL_MESSAGE_TEXTAREA)
+        self._add_note_button = page.locator(MODAL_ADD_NOTE_BUTTON)
+        self._send_button = page.locator(MODAL_SEND_BUTTON)
+        self._locators_generation = self.browser.page_generation
     
     def run_automation(self, base_url: str, start_page: int, end_page: int, limit: int, message: Optional[str] = None) -> None:
         """
@@ -193,6 +216,7 @@ class SalesNavConnectionManager:
     
     def _send_connection(self, item, message: Optional[str] = None) -> bool:
         """Execute the 3 dots -> Connect -> Send flow for a single item."""
+        self._bind_locators()
         try:
             # 1. Click 3 dots button
             three_dots = item.query_selector(THREE_DOTS_BUTTON)
@@ -208,16 +232,8 @@ class SalesNavConnectionManager:
                 self.browser.humanizer.random_delay(1500, 3000)
                 
                 # 2. Click Connect option in dropdown
-                connect_selectors = [
-                    CONNECT_OPTION,
-                    "div.artdeco-dropdown__item:has-text('Connect')",
-                    "li:has-text('Connect')",
-                    "div[data-control-name='connect']"
-                ]
-                
                 clicked_connect = False
-                for sel in connect_selectors:
-                    option = self.browser.page.locator(sel).first
+                for option in self._connect_options:
                     if option.is_visible():
                         option.click()
                         clicked_connect = True
@@ -229,15 +245,14 @@ class SalesNavConnectionManager:
                     return False
             
             # 3. Handle modal
-            if not self.browser.wait_for_element("div.artdeco-modal", timeout=10000):
+            if not self.browser.wait_for_element(CONNECT_MODAL, timeout=10000):
                 logger.warning("Connection modal did not appear.")
                 return False
             
             # 4. Check if email is required (Edge Case)
-            email_field = self.browser.page.locator(MODAL_EMAIL_REQUIRED_FIELD)
-            if email_field.is_visible():
+            if self._email_field.is_visible():
                 logger.warning("Email is required to connect with this profile. Skipping...")
-                cancel_btn = self.browser.page.locator(MODAL_CANCEL_BUTTON)
+                cancel_btn = self._cancel_button
                 if cancel_btn.is_visible():
                     cancel_btn.click()
                 else:
@@ -250,10 +265,10 @@ class SalesNavConnectionManager:
                 # Wait for the modal content to settle
                 self.browser.humanizer.random_delay(1000, 2000)
                 
-                textarea = self.browser.page.locator(MODAL_MESSAGE_TEXTAREA)
+                textarea = self._message_textarea
                 if not textarea.is_visible():
                     # Check for "Add a note" button
-                    add_note = self.browser.page.locator(MODAL_ADD_NOTE_BUTTON)
+                    add_note = self._add_note_button
                     if add_note.is_visible():
                         add_note.click()
                         # Wait for textarea to appear after click
@@ -275,7 +290,7 @@ class SalesNavConnectionManager:
                     logger.warning("Message textarea not visible even after clicking 'Add a note'.")
             
             # 4. Click Send invitation
-            send_btn = self.browser.page.locator(MODAL_SEND_BUTTON)
+            send_btn = self._send_button
             if send_btn.is_visible() and send_btn.is_enabled():
                 send_btn.click()
                 logger.info("Connection request sent.")
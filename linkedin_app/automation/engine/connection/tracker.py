@@ -35,9 +35,9 @@ class ConnectionTracker:
             note=request.note,
             error=request.error
         )
-        self.db.record_daily_stat("connections_sent")
+        self.db.queue_daily_stat("connections_sent")
         if request.status == ConnectionStatus.ERROR:
-            self.db.record_daily_stat("errors")
+            self.db.queue_daily_stat("errors")
         
         logger.debug(f"Recorded connection request in database: {request.profile_url}")
     
@@ -53,7 +53,7 @@ class ConnectionTracker:
         """Update the status of a connection request in the database."""
         self.db.record_connection_status(profile_url, status.value)
         if status == ConnectionStatus.ACCEPTED:
-            self.db.record_daily_stat("connections_accepted")
+            self.db.queue_daily_stat("connections_accepted")
         
         logger.info(f"Updated connection status in database: {profile_url} -> {status}")
     
@@ -2,14 +2,156 @@
 PostgreSQL database connection and query management.
 """
 
+import csv
+import io
+import select
+import threading
+from collections import Counter
+from dataclasses import fields
+from functools import lru_cache
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from typing import List, Optional, Dict, Any, Tuple, Set
+from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
+from psycopg2.extras import RealDictCursor, execute_values
 from loguru import logger
 
 from ..utils.models import Profile
 
+# Fields a fetched row may populate on Profile
+_PROFILE_FIELDS = frozenset(f.name for f in fields(Profile) if f.init)
+
+
+# Counter columns of automation_dailystats (also the valid stat categories)
+DAILY_STAT_COLUMNS = (
+    "connections_sent",
+    "connections_accepted",
+    "messages_sent",
+    "profiles_searched",
+    "errors",
+)
+_DAILY_STAT_INDEX = {col: i for i, col in enumerate(DAILY_STAT_COLUMNS)}
+_DAILY_STAT_COL_STR = ", ".join(DAILY_STAT_COLUMNS)
+_DAILY_STAT_PLACEHOLDERS = ", ".join(["%s"] * len(DAILY_STAT_COLUMNS))
+_DAILY_STAT_QUERIES = {
+    col: f"""
+        INSERT INTO public.automation_dailystats (date, {_DAILY_STAT_COL_STR})
+        VALUES (%s, {_DAILY_STAT_PLACEHOLDERS})
+        ON CONFLICT (date) DO UPDATE SET
+            {col} = public.automation_dailystats.{col} + EXCLUDED.{col}
+        """
+    for col in DAILY_STAT_COLUMNS
+}
+_DAILY_STAT_INCREMENTS = ", ".join(
+    f"{col} = public.automation_dailystats.{col} + EXCLUDED.{col}" for col in DAILY_STAT_COLUMNS
+)
+_DAILY_STAT_FLUSH_QUERY = f"""
+    INSERT INTO public.automation_dailystats (date, {_DAILY_STAT_COL_STR})
+    VALUES (%s, {_DAILY_STAT_PLACEHOLDERS})
+    ON CONFLICT (date) DO UPDATE SET {_DAILY_STAT_INCREMENTS}
+    """
+
+# Channel notified by a trigger whenever a new row lands in linkedin_db_network_data
+NETWORK_DATA_CHANNEL = "nd_new"
+# Supabase's transaction pooler port; sessions are not pinned to a backend there,
+# so LISTEN registrations are lost between statements
+TRANSACTION_POOLER_PORT = 6543
+
+# Batches at least this large are loaded via COPY instead of per-row upserts
+BULK_COPY_THRESHOLD = 1024
+
+_NETWORK_DATA_COLUMNS = ("linkedin_url", "name", "first_name", "last_name", "keywords", "location")
+
+
+def _copy_value(value: Optional[str]) -> str:
+    """Render a nullable value for COPY ... WITH (FORMAT csv, NULL '\\N')."""
+    return "\\N" if value is None else value
+
+
+def _pg_text_array(values: List[str]) -> str:
+    """Render a list of strings as a Postgres text[] literal."""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"') for v in values)
+    return "{" + ",".join(f'"{v}"' for v in escaped) + "}"
+
+
+# Max entries kept per history lookup cache
+LOOKUP_CACHE_SIZE = 8192
+
+
+def _cache_put(cache: Dict[str, bool], key: str, value: bool) -> None:
+    """Store a lookup result, evicting the oldest entry when the cache is full."""
+    if key not in cache and len(cache) >= LOOKUP_CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+# Per-action history inserts. Plain parameterized statements: server-side PREPARE does
+# not survive Supabase's transaction pooler, which may run EXECUTE on another backend
+CONNECTION_HISTORY_INSERT = (
+    "INSERT INTO public.automation_connectiontracking (profile_url, profile_name, sent_at, status, note, error) "
+    "VALUES (%s, %s, NOW(), %s, %s, %s)"
+)
+MESSAGE_HISTORY_INSERT = (
+    "INSERT INTO public.automation_messagetracking (recipient_url, recipient_name, content, sent_at, template_used, error) "
+    "VALUES (%s, %s, %s, NOW(), %s, %s)"
+)
+
+
+@lru_cache(maxsize=64)
+def _build_fetch_urls_query(
+    table_name: str,
+    url_column: str,
+    additional_columns: Tuple[str, ...],
+    exclude_table: Optional[str],
+    exclude_url_column: Optional[str],
+    where_clause: str,
+    ordered: bool,
+) -> sql.Composed:
+    """Build (and memoize) the SELECT used by DatabaseManager.fetch_linkedin_urls."""
+    main_alias = sql.Identifier("t")
+    url_ident = sql.Identifier(url_column)
+    
+    # Trim in SQL so rows need no per-value cleanup in Python
+    effective_columns = [sql.SQL("TRIM({}.{}) AS {}").format(main_alias, url_ident, url_ident)]
+    effective_columns.extend(
+        sql.SQL("TRIM({}.{}::text) AS {}").format(main_alias, sql.Identifier(col), sql.Identifier(col))
+        for col in additional_columns
+    )
+    
+    query = sql.SQL("SELECT {} FROM {} {}").format(
+        sql.SQL(", ").join(effective_columns),
+        sql.Identifier("public", table_name),
+        main_alias,
+    )
+    
+    where_conditions = []
+    if exclude_table:
+        if exclude_table == "connection_requests":
+            exclude_table = "linkedin_db_connection_requests"
+        
+        exclude_alias = sql.Identifier("e")
+        exclude_url_ident = sql.Identifier(exclude_url_column or url_column)
+        query += sql.SQL(" LEFT JOIN {} {} ON {}.{} = {}.{}").format(
+            sql.Identifier("public", exclude_table),
+            exclude_alias,
+            main_alias, url_ident,
+            exclude_alias, exclude_url_ident,
+        )
+        where_conditions.append(sql.SQL("{}.{} IS NULL").format(exclude_alias, exclude_url_ident))
+    
+    if where_clause:
+        # Caller-supplied SQL fragment (from config), used verbatim
+        where_conditions.append(sql.SQL("({})").format(sql.SQL(where_clause)))
+    
+    if where_conditions:
+        query += sql.SQL(" WHERE ") + sql.SQL(" AND ").join(where_conditions)
+    
+    if ordered:
+        query += sql.SQL(" ORDER BY {}.{}").format(main_alias, url_ident)
+    
+    return query
+
+
 class DatabaseManager:
     """
     Manages PostgreSQL database connections and queries for LinkedIn URLs.
@@ -23,6 +165,8 @@ class DatabaseManager:
         user: str,
         password: str,
         schema: str = "public",
+        min_connections: int = 2,
+        max_connections: int = 8,
     ):
         self.host = host
         self.port = port
@@ -30,20 +174,35 @@ class DatabaseManager:
         self.user = user
         self.password = password
         self.schema = schema
-        self.conn = None
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self._pool: Optional[ThreadedConnectionPool] = None
+        self._local = threading.local()
+        
+        # In-process caches of history lookups, keyed by profile URL
+        self._sent_cache: Dict[str, bool] = {}
+        self._messaged_cache: Dict[str, bool] = {}
+        
+        # Daily stat increments not yet written (see queue_daily_stat)
+        self._pending_stats: Counter = Counter()
+        # Increments taken by a flush whose upsert has not committed yet
+        self._inflight_stats: Counter = Counter()
+        self._stats_lock = threading.Lock()
+        self._listening_conn = None  # connection that issued LISTEN
     
     def connect(self) -> None:
-        """Create database connection."""
+        """Create the database connection pool."""
         try:
-            self.conn = psycopg2.connect(
+            self._pool = ThreadedConnectionPool(
+                self.min_connections,
+                self.max_connections,
                 host=self.host,
                 port=self.port,
                 database=self.database,
                 user=self.user,
                 password=self.password,
             )
-            self.conn.autocommit = True
-            logger.info("Database connection established successfully")
+            logger.info("Database connection pool established successfully")
             
             # Initialize schema for network data
             self.create_network_data_table()
@@ -51,11 +210,45 @@ class DatabaseManager:
             logger.error(f"Failed to connect to database: {e}")
             raise
     
+    @property
+    def conn(self):
+        """
+        Connection for the calling thread.
+        
+        Each thread checks out its own pooled connection on first use and keeps
+        it until release_connection() or close(), so a thread's statements stay
+        on one session (needed for LISTEN and multi-statement transactions).
+        """
+        if not self._pool:
+            return None
+        conn = getattr(self._local, "conn", None)
+        if conn is None or conn.closed:
+            try:
+                conn = self._pool.getconn(key=threading.get_ident())
+                conn.autocommit = True
+            except Exception as e:
+                logger.error(f"Failed to get database connection: {e}")
+                return None
+            self._local.conn = conn
+        return conn
+    
+    def release_connection(self) -> None:
+        """Return the calling thread's connection to the pool."""
+        conn = getattr(self._local, "conn", None)
+        self._local.conn = None
+        if self._pool and conn is not None:
+            try:
+                self._pool.putconn(conn, key=threading.get_ident())
+            except Exception as e:
+                logger.error(f"Failed to release database connection: {e}")
+    
     def close(self) -> None:
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
-            logger.info("Database connection closed")
+        """Close all pooled database connections."""
+        if self._pool:
+            self.flush_daily_stats()
+            self._pool.closeall()
+            self._pool = None
+            logger.info("Database connection pool closed")
     
     def fetch_linkedin_urls(
         self,
@@ -66,57 +259,39 @@ class DatabaseManager:
         additional_columns: Optional[List[str]] = None,
         exclude_table: Optional[str] = None,
         exclude_url_column: Optional[str] = None,
+        ordered: bool = False,
     ) -> List[Profile]:
-        """Fetch LinkedIn URLs from the database and create Profile objects."""
+        """
+        Fetch LinkedIn URLs from the database and create Profile objects.
+        
+        Rows come back in arbitrary order unless ``ordered`` is set, which sorts by URL.
+        """
         if not self.conn:
             raise RuntimeError("Database not connected. Call connect() first.")
         
         profiles = []
         try:
-            main_alias = "t"
-            effective_columns = [f'{main_alias}."{url_column}"']
-            if additional_columns:
-                effective_columns.extend([f'{main_alias}."{col}"' for col in additional_columns])
-            
-            effective_schema = 'public'
-            schema_quoted = f'"{effective_schema}"'
-            table_quoted = f'"{table_name}"'
-            
-            query = f'SELECT {", ".join(effective_columns)} FROM {schema_quoted}.{table_quoted} {main_alias}'
-            
-            if exclude_table:
-                if exclude_table == "connection_requests" and not "linkedin_db_" in exclude_table:
-                    exclude_table = "linkedin_db_connection_requests"
-                
-                exclude_table_quoted = f'"{exclude_table}"'
-                exclude_url_col = exclude_url_column or url_column
-                query += f' LEFT JOIN {schema_quoted}.{exclude_table_quoted} e '
-                query += f'ON {main_alias}."{url_column}" = e."{exclude_url_col}"'
-                
-                where_conditions = [f'e."{exclude_url_col}" IS NULL']
-                if where_clause:
-                    clean_where = where_clause.strip()
-                    if clean_where.upper().startswith("WHERE "):
-                        clean_where = clean_where[6:].strip()
-                    if clean_where:
-                        where_conditions.append(f"({clean_where})")
-                
-                query += f" WHERE {' AND '.join(where_conditions)}"
-            else:
-                if where_clause:
-                    clean_where = where_clause.strip()
-                    if clean_where.upper().startswith("WHERE "):
-                        clean_where = clean_where[6:].strip()
-                    if clean_where:
-                        query += f" WHERE {clean_where}"
+            clean_where = ""
+            if where_clause:
+                clean_where = where_clause.strip()
+                if clean_where.upper().startswith("WHERE "):
+                    clean_where = clean_where[6:].strip()
             
-            query += f' ORDER BY {main_alias}."{url_column}"'
+            query = _build_fetch_urls_query(
+                table_name,
+                url_column,
+                tuple(additional_columns or ()),
+                exclude_table,
+                exclude_url_column,
+                clean_where,
+                ordered,
+            )
             if limit:
-                query += f" LIMIT {limit}"
+                query = sql.SQL("{} LIMIT {}").format(query, sql.Literal(limit))
             
-            logger.debug(f"Executing query: {query}")
+            logger.opt(lazy=True).debug("Executing query: {}", lambda: query.as_string(self.conn))
             
-            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+            with self.conn.cursor() as cur:
                 cur.execute(query)
                 rows = cur.fetchall()
             
@@ -128,21 +303,24 @@ class DatabaseManager:
                 'snippet': 'headline',
                 'job_title': 'title',
             }
+            # (row index, Profile field) for each additional column, resolved once per query
+            field_slots = []
+            for idx, col in enumerate(additional_columns or [], 1):
+                field_name = column_mapping.get(col, col)
+                if field_name in _PROFILE_FIELDS:
+                    field_slots.append((idx, field_name))
+                else:
+                    logger.warning(f"Ignoring column '{col}': no matching Profile field")
             
+            # One timestamp for the whole result set
+            fetched_at = datetime.now()
             for row in rows:
+                url = row[0]
+                if not url: continue
                 try:
-                    url = row[url_column]
-                    if not url: continue
-                    url = url.strip()
-                    profile_data = {"url": url}
-                    
-                    if additional_columns:
-                        for col in additional_columns:
-                            if col in row and row[col] is not None:
-                                field_name = column_mapping.get(col, col)
-                                profile_data[field_name] = str(row[col]).strip()
-                    
-                    profiles.append(Profile(**profile_data))
+                    extra = {field: row[idx] for idx, field in field_slots if row[idx] is not None}
+                    extra.setdefault("scraped_at", fetched_at)
+                    profiles.append(Profile(url=url, **extra))
                 except Exception as e:
                     logger.warning(f"Failed to create profile from row: {e}")
             
@@ -167,7 +345,7 @@ class DatabaseManager:
     def create_network_data_table(self) -> None:
         """Create the linkedin_db_network_data table if it doesn't exist."""
         if not self.conn: return
-        query = """
+        query = f"""
         CREATE EXTENSION IF NOT EXISTS "pgcrypto";
         CREATE TABLE IF NOT EXISTS public.linkedin_db_network_data (
             id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -190,6 +368,25 @@ class DatabaseManager:
         );
         CREATE UNIQUE INDEX IF NOT EXISTS linkedin_db_network_data_linkedin_url_idx 
         ON public.linkedin_db_network_data (linkedin_url);
+        CREATE OR REPLACE FUNCTION public.nd_notify() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{NETWORK_DATA_CHANNEL}', NEW.linkedin_url);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        DO $$
+        BEGIN
+            -- Only create it once: (re)creating a trigger locks the whole table
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_trigger
+                WHERE tgname = 'nd_notify_insert'
+                AND tgrelid = 'public.linkedin_db_network_data'::regclass
+            ) THEN
+                CREATE TRIGGER nd_notify_insert AFTER INSERT ON public.linkedin_db_network_data
+                FOR EACH ROW EXECUTE FUNCTION public.nd_notify();
+            END IF;
+        END
+        $$;
         """
         try:
             with self.conn.cursor() as cur:
@@ -224,10 +421,131 @@ class DatabaseManager:
             logger.error(f"Failed to upsert network profile: {e}")
             return False
 
+    def upsert_network_profiles(self, profiles: List[Dict[str, Any]]) -> int:
+        """
+        Insert or update many profiles in network data table.
+        
+        Large batches go through bulk_load_profiles(); smaller ones use per-row upserts.
+        
+        Returns:
+            Number of profiles saved.
+        """
+        if len(profiles) >= BULK_COPY_THRESHOLD:
+            return self.bulk_load_profiles(profiles)
+        return sum(1 for profile_data in profiles if self.upsert_network_profile(profile_data))
+
+    def bulk_load_profiles(self, profiles: List[Dict[str, Any]]) -> int:
+        """
+        Load profiles into network data table via COPY into a staging table.
+        
+        Returns:
+            Number of profiles saved (0 on failure).
+        """
+        conn = self.conn
+        if not conn or not profiles: return 0
+        
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for profile_data in profiles:
+            keywords = profile_data.get('keywords') or []
+            writer.writerow([
+                profile_data.get('linkedin_url'),
+                profile_data.get('name'),
+                _copy_value(profile_data.get('first_name')),
+                _copy_value(profile_data.get('last_name')),
+                _pg_text_array(keywords),
+                _copy_value(profile_data.get('location')),
+            ])
+        buf.seek(0)
+        
+        columns = ", ".join(_NETWORK_DATA_COLUMNS)
+        # Staging table lives for the duration of the transaction only
+        conn.autocommit = False
+        try:
+            with conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "CREATE TEMP TABLE staging_nd "
+                        "(LIKE public.linkedin_db_network_data INCLUDING DEFAULTS) ON COMMIT DROP"
+                    )
+                    cur.copy_expert(
+                        f"COPY staging_nd ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                        buf,
+                    )
+                    cur.execute(f"""
+                    INSERT INTO public.linkedin_db_network_data ({columns})
+                    SELECT DISTINCT ON (linkedin_url) {columns} FROM staging_nd
+                    ON CONFLICT (linkedin_url) DO UPDATE SET
+                        name = EXCLUDED.name,
+                        updated_at = NOW()
+                    """)
+                    saved = cur.rowcount
+            logger.info(f"Bulk loaded {saved} network profiles")
+            return saved
+        except Exception as e:
+            logger.error(f"Failed to bulk load network profiles: {e}")
+            return 0
+        finally:
+            conn.autocommit = True
+
+    def listen_for_profiles(self) -> bool:
+        """
+        Subscribe this thread's connection to new network profile inserts.
+        
+        Call before fetching so no insert is missed between the fetch and a
+        later wait_for_profiles(). Skipped through the transaction pooler,
+        where LISTEN does not persist.
+        
+        Returns:
+            True if notifications will be delivered.
+        """
+        conn = self.conn
+        if not conn: return False
+        if int(self.port) == TRANSACTION_POOLER_PORT:
+            logger.debug("Transaction pooler in use; not listening for new profiles")
+            return False
+        if self._listening_conn is conn:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {NETWORK_DATA_CHANNEL}")
+            self._listening_conn = conn
+            return True
+        except Exception as e:
+            logger.error(f"Failed to listen for new profiles: {e}")
+            return False
+
+    def wait_for_profiles(self, timeout: float) -> bool:
+        """
+        Block until a new network profile is inserted or the timeout expires.
+        
+        Relies on listen_for_profiles(), so no queries are issued while idle.
+        A timeout of 0 only checks for inserts already notified.
+        
+        Returns:
+            True if new profiles may be available, False on timeout or when
+            not listening.
+        """
+        conn = self.conn
+        if not conn or self._listening_conn is not conn: return False
+        try:
+            conn.poll()
+            if not conn.notifies:
+                if select.select([conn], [], [], timeout) == ([], [], []):
+                    return False
+                conn.poll()
+            
+            notified = bool(conn.notifies)
+            conn.notifies.clear()
+            return notified
+        except Exception as e:
+            logger.error(f"Failed to wait for new profiles: {e}")
+            return False
+
     def get_profiles_for_filtering(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Fetch profiles that need activity scraping."""
         if not self.conn: return []
-        query = "SELECT linkedin_url, name FROM public.linkedin_db_network_data WHERE scrape_status IN ('not_scraped', 'failed') LIMIT %s"
+        query = "SELECT linkedin_url, name, first_name, last_name, location FROM public.linkedin_db_network_data WHERE scrape_status IN ('not_scraped', 'failed') LIMIT %s"
         try:
             with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute(query, (limit,))
@@ -260,10 +578,29 @@ class DatabaseManager:
             logger.error(f"Failed to update activity: {e}")
             return False
 
+    def mark_profiles_scraped_without_activity(self, urls: List[str]) -> bool:
+        """Mark many profiles as scraped with no recent activity in a single UPDATE."""
+        if not self.conn: return False
+        if not urls:
+            return True
+        query = """
+        UPDATE public.linkedin_db_network_data
+        SET recent_activity_raw = NULL, recent_activity_value = NULL, recent_activity_unit = NULL,
+            recent_activity_minutes = NULL, scrape_status = 'scraped', scraped_at = NOW(), updated_at = NOW()
+        WHERE linkedin_url = ANY(%s)
+        """
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(query, (list(urls),))
+            return True
+        except Exception as e:
+            logger.error(f"Failed to mark profiles as scraped: {e}")
+            return False
+
     def get_profiles_for_sending(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Fetch profiles eligible for requests."""
         if not self.conn: return []
-        query = "SELECT linkedin_url, name, first_name, last_name FROM public.linkedin_db_network_data WHERE scrape_status = 'scraped' AND request_status = 'not_sent' LIMIT %s"
+        query = "SELECT linkedin_url, name, first_name, last_name, location, recent_activity_minutes FROM public.linkedin_db_network_data WHERE scrape_status = 'scraped' AND request_status = 'not_sent' LIMIT %s"
         try:
             with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute(query, (limit,))
@@ -284,65 +621,82 @@ class DatabaseManager:
             logger.error(f"Failed to update connection status: {e}")
             return False
 
+    def bulk_update_request_status(self, rows: List[Tuple[str, str]]) -> bool:
+        """Update connection status for many (url, status) pairs in a single statement."""
+        if not self.conn: return False
+        if not rows:
+            return True
+        query = """
+        UPDATE public.linkedin_db_network_data AS nd
+        SET request_status = v.status,
+            request_sent_at = CASE WHEN v.status = 'not_sent' THEN NULL ELSE NOW() END,
+            updated_at = NOW()
+        FROM (VALUES %s) AS v(url, status)
+        WHERE nd.linkedin_url = v.url
+        """
+        try:
+            with self.conn.cursor() as cur:
+                execute_values(cur, query, rows)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to bulk update connection status: {e}")
+            return False
+
     def record_daily_stat(self, category: str, count: int = 1) -> bool:
         """Increment daily statistic for a specific category."""
         if not self.conn: return False
-        today = date.today().isoformat()
         
-        # Mapping categories to column names
-        column_map = {
-            "connections_sent": "connections_sent",
-            "connections_accepted": "connections_accepted",
-            "messages_sent": "messages_sent",
-            "profiles_searched": "profiles_searched",
-            "errors": "errors"
-        }
-        
-        column = column_map.get(category)
-        if not column:
+        query = _DAILY_STAT_QUERIES.get(category)
+        if not query:
             logger.error(f"Invalid stat category: {category}")
             return False
-            
-        query = f"""
-        INSERT INTO public.automation_dailystats (
-            date, connections_sent, connections_accepted, 
-            messages_sent, profiles_searched, errors
-        )
-        VALUES (%s, %s, 0, 0, 0, 0)
-        ON CONFLICT (date) DO UPDATE SET
-            {column} = public.automation_dailystats.{column} + EXCLUDED.{column}
-        """
-        
-        # Prepare value: if we are incrementing, EXCLUDED.{column} will be count.
-        # But for the initial INSERT, we need to put the count in the correct column.
-        
-        # Actually, let's make it even simpler and more robust:
-        # Use a dynamic query that sets the target column to 'count' and others to 0 on INSERT.
-        
-        cols = ["connections_sent", "connections_accepted", "messages_sent", "profiles_searched", "errors"]
-        vals = [0] * len(cols)
-        if category in column_map:
-            col_idx = cols.index(column_map[category])
-            vals[col_idx] = count
-            
-        col_str = ", ".join(cols)
-        val_placeholders = ", ".join(["%s"] * len(vals))
         
-        query = f"""
-        INSERT INTO public.automation_dailystats (date, {col_str})
-        VALUES (%s, {val_placeholders})
-        ON CONFLICT (date) DO UPDATE SET
-            {column} = public.automation_dailystats.{column} + EXCLUDED.{column}
-        """
+        # Insert the count in the target column and 0 elsewhere; on conflict only
+        # the target column is incremented.
+        vals = [0] * len(DAILY_STAT_COLUMNS)
+        vals[_DAILY_STAT_INDEX[category]] = count
         
         try:
             with self.conn.cursor() as cur:
-                cur.execute(query, [today] + vals)
+                cur.execute(query, [date.today().isoformat()] + vals)
             return True
         except Exception as e:
             logger.error(f"Failed to record daily stat: {e}")
             return False
 
+    def queue_daily_stat(self, category: str, count: int = 1) -> bool:
+        """Buffer a daily statistic increment until the next flush_daily_stats()."""
+        if category not in _DAILY_STAT_INDEX:
+            logger.error(f"Invalid stat category: {category}")
+            return False
+        with self._stats_lock:
+            self._pending_stats[category] += count
+        return True
+
+    def flush_daily_stats(self) -> bool:
+        """Write all buffered daily statistic increments in a single upsert."""
+        if not self.conn: return False
+        with self._stats_lock:
+            pending, self._pending_stats = self._pending_stats, Counter()
+            self._inflight_stats.update(pending)
+        if not pending:
+            return True
+        
+        vals = [pending[col] for col in DAILY_STAT_COLUMNS]
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(_DAILY_STAT_FLUSH_QUERY, [date.today().isoformat()] + vals)
+            with self._stats_lock:
+                self._inflight_stats.subtract(pending)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to flush daily stats: {e}")
+            # Keep the increments for the next flush
+            with self._stats_lock:
+                self._inflight_stats.subtract(pending)
+                self._pending_stats.update(pending)
+            return False
+
     def get_daily_stat(self, category: str, date_str: Optional[str] = None) -> int:
         """Get statistic for a specific category and date."""
         if not self.conn: return 0
@@ -356,12 +710,20 @@ class DatabaseManager:
         column = column_map.get(category)
         if not column: return 0
         
+        # Increments not yet committed for today. Read before the query, so a flush
+        # committing in between over-counts rather than under-counts
+        buffered = 0
+        if date_val == date.today().isoformat():
+            with self._stats_lock:
+                buffered = self._pending_stats[category] + self._inflight_stats[category]
+        
         query = f"SELECT {column} FROM public.automation_dailystats WHERE date = %s"
         try:
             with self.conn.cursor() as cur:
                 cur.execute(query, (date_val,))
                 row = cur.fetchone()
-                return row[0] if row else 0
+            count = row[0] if row else 0
+            return count + buffered
         except Exception as e:
             logger.error(f"Failed to get daily stat: {e}")
             return 0
@@ -369,13 +731,10 @@ class DatabaseManager:
     def record_connection_history(self, profile_url: str, profile_name: str, status: str, note: str = "", error: str = None) -> bool:
         """Record connection request in history table."""
         if not self.conn: return False
-        query = """
-        INSERT INTO public.automation_connectiontracking (profile_url, profile_name, sent_at, status, note, error)
-        VALUES (%s, %s, NOW(), %s, %s, %s)
-        """
         try:
             with self.conn.cursor() as cur:
-                cur.execute(query, (profile_url, profile_name, status, note, error))
+                cur.execute(CONNECTION_HISTORY_INSERT, (profile_url, profile_name, status, note, error))
+            _cache_put(self._sent_cache, profile_url, True)
             return True
         except Exception as e:
             logger.error(f"Failed to record connection history: {e}")
@@ -384,11 +743,16 @@ class DatabaseManager:
     def is_connection_sent(self, profile_url: str) -> bool:
         """Check if connection was already sent to this URL."""
         if not self.conn: return False
+        cached = self._sent_cache.get(profile_url)
+        if cached is not None:
+            return cached
         query = "SELECT 1 FROM public.automation_connectiontracking WHERE profile_url = %s LIMIT 1"
         try:
             with self.conn.cursor() as cur:
                 cur.execute(query, (profile_url,))
-                return cur.fetchone() is not None
+                sent = cur.fetchone() is not None
+            _cache_put(self._sent_cache, profile_url, sent)
+            return sent
         except Exception as e:
             logger.error(f"Failed to check connection history: {e}")
             return False
@@ -396,13 +760,11 @@ class DatabaseManager:
     def record_message_history(self, recipient_url: str, recipient_name: str, content: str, template: str = "", error: str = None) -> bool:
         """Record message in history table."""
         if not self.conn: return False
-        query = """
-        INSERT INTO public.automation_messagetracking (recipient_url, recipient_name, content, sent_at, template_used, error)
-        VALUES (%s, %s, %s, NOW(), %s, %s)
-        """
         try:
             with self.conn.cursor() as cur:
-                cur.execute(query, (recipient_url, recipient_name, content, template, error))
+                cur.execute(MESSAGE_HISTORY_INSERT, (recipient_url, recipient_name, content, template, error))
+            if error is None:
+                _cache_put(self._messaged_cache, recipient_url, True)
             return True
         except Exception as e:
             logger.error(f"Failed to record message history: {e}")
@@ -411,15 +773,72 @@ class DatabaseManager:
     def is_already_messaged(self, profile_url: str) -> bool:
         """Check if profile was already messaged successfully."""
         if not self.conn: return False
+        cached = self._messaged_cache.get(profile_url)
+        if cached is not None:
+            return cached
         query = "SELECT 1 FROM public.automation_messagetracking WHERE recipient_url = %s AND error IS NULL LIMIT 1"
         try:
             with self.conn.cursor() as cur:
                 cur.execute(query, (profile_url,))
-                return cur.fetchone() is not None
+                messaged = cur.fetchone() is not None
+            _cache_put(self._messaged_cache, profile_url, messaged)
+            return messaged
         except Exception as e:
             logger.error(f"Failed to check message history: {e}")
             return False
 
+    def bulk_lookup_statuses(self, profile_urls: List[str]) -> Dict[str, str]:
+        """Return the most recent connection history status for each of profile_urls that has one."""
+        if not self.conn or not profile_urls: return {}
+        query = """
+        SELECT DISTINCT ON (profile_url) profile_url, status
+        FROM public.automation_connectiontracking
+        WHERE profile_url = ANY(%s)
+        ORDER BY profile_url, sent_at DESC
+        """
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(query, (profile_urls,))
+                statuses = dict(cur.fetchall())
+            for url in profile_urls:
+                _cache_put(self._sent_cache, url, url in statuses)
+            return statuses
+        except Exception as e:
+            logger.error(f"Failed to look up connection statuses: {e}")
+            return {}
+
+    def get_messaged_urls(self, profile_urls: List[str]) -> Set[str]:
+        """Return the subset of profile_urls that were already messaged successfully, in one query."""
+        if not self.conn or not profile_urls: return set()
+        unknown = [url for url in profile_urls if url not in self._messaged_cache]
+        if unknown:
+            query = """
+            SELECT DISTINCT recipient_url FROM public.automation_messagetracking
+            WHERE recipient_url = ANY(%s) AND error IS NULL
+            """
+            try:
+                with self.conn.cursor() as cur:
+                    cur.execute(query, (unknown,))
+                    found = {row[0] for row in cur.fetchall()}
+                for url in unknown:
+                    _cache_put(self._messaged_cache, url, url in found)
+            except Exception as e:
+                logger.error(f"Failed to check message history: {e}")
+                return set()
+        return {url for url in profile_urls if self._messaged_cache.get(url)}
+
+    def fetch_messaged_urls(self) -> Set[str]:
+        """Return every profile URL that was messaged successfully."""
+        if not self.conn: return set()
+        query = "SELECT DISTINCT recipient_url FROM public.automation_messagetracking WHERE error IS NULL"
+        try:
+            with self.conn.cursor() as cur:
+                cur.execute(query)
+                return {row[0] for row in cur.fetchall()}
+        except Exception as e:
+            logger.error(f"Failed to fetch messaged profiles: {e}")
+            return set()
+
     def delete_from_raw_ingest(self, url: str) -> bool:
         """Delete from raw_linkedin_ingest."""
         if not self.conn: return False
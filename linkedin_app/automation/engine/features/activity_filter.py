@@ -16,6 +16,24 @@ COMMENTS_BUTTON_SELECTOR = "button:has(span.artdeco-pill__text:text-is('Comments
 SUB_DESCRIPTION_SELECTOR = ".update-components-actor__sub-description" 
 MINI_UPDATE_SUB_DESCRIPTION_SELECTOR = ".feed-mini-update-contextual-description__text"
 
+# How long to wait for newly scraped profiles when the queue is empty, once a
+# scraper has been seen adding profiles during this run
+IDLE_WAIT_SECONDS = 30
+
+# Single round-trip probe mirroring the selectors above: finds the Activity card and
+# reports which filter pills (Posts / Comments) it offers.
+ACTIVITY_PROBE_SCRIPT = """
+() => {
+    const section = [...document.querySelectorAll('section.artdeco-card')].find(
+        sec => [...sec.querySelectorAll('h2')].some(h => /Activity/i.test(h.textContent))
+    );
+    if (!section) return {hasSection: false, hasPosts: false, hasComments: false};
+    const pills = [...section.querySelectorAll('button span.artdeco-pill__text')]
+        .map(span => span.textContent.trim());
+    return {hasSection: true, hasPosts: pills.includes('Posts'), hasComments: pills.includes('Comments')};
+}
+"""
+
 class ActivityFilter:
     def __init__(self, browser: BrowserEngine, db: DatabaseManager, connection_manager: ConnectionManager):
         self.browser = browser
@@ -31,18 +49,29 @@ class ActivityFilter:
         
         requests_sent_session = 0
         batch_size = 10
+        # Subscribe before the first fetch so inserts made meanwhile are not missed
+        listening = self.db.listen_for_profiles()
+        # Set once a scraper is seen adding profiles; only then is it worth waiting for more
+        scraper_active = False
         
         while requests_sent_session < target_connections:
             # Fetch batch of unscraped profiles
             profiles = self.db.get_profiles_for_filtering(limit=batch_size)
             
             if not profiles:
+                # Without an active scraper only pick up inserts already notified, don't idle
+                wait = IDLE_WAIT_SECONDS if scraper_active else 0
+                if listening and self.db.wait_for_profiles(timeout=wait):
+                    scraper_active = True
+                    continue
                 logger.info("No more unscraped profiles found in database.")
                 break
                 
             logger.info(f"Fetched batch of {len(profiles)} profiles. Sent so far: {requests_sent_session}/{target_connections}")
             
             processed_in_batch = 0
+            # Profiles without an Activity section, marked scraped in one UPDATE after the batch
+            skipped_urls = []
             
             for profile in profiles:
                 if requests_sent_session >= target_connections:
@@ -64,31 +93,25 @@ class ActivityFilter:
                     self.browser.scroll(amount=600)
                     self.browser.humanizer.random_delay(1000, 2000)
                     
-                    activity_section = self.browser.page.locator(ACTIVITY_SECTION_SELECTOR).filter(
-                        has=self.browser.page.locator("h2", has_text=HEADER_TEXT_REGEX)
-                    )
-                    
-                    section_count = activity_section.count()
+                    probe = self.browser.evaluate(ACTIVITY_PROBE_SCRIPT)
                     
-                    if section_count == 0:
+                    if not probe["hasSection"]:
                         logger.warning(f"No Activity section found for {url}. Skipping.")
-                        self.db.update_network_activity(url, {
-                            "raw": None, "value": None, "unit": None, "minutes": None, "status": "scraped"
-                        })
+                        skipped_urls.append(url)
                         continue
                     
                     # 3. Check / Click Buttons (Posts, Comments)
                     recency_candidates = []
                     
-                    posts_btn = activity_section.locator(POSTS_BUTTON_SELECTOR)
-                    comments_btn = activity_section.locator(COMMENTS_BUTTON_SELECTOR)
-                    
-                    has_posts = posts_btn.count() > 0
-                    has_comments = comments_btn.count() > 0
+                    activity_section = self.browser.page.locator(ACTIVITY_SECTION_SELECTOR).filter(
+                        has=self.browser.page.locator("h2", has_text=HEADER_TEXT_REGEX)
+                    )
                     
                     views_to_check = []
-                    if has_posts: views_to_check.append(("Posts", posts_btn))
-                    if has_comments: views_to_check.append(("Comments", comments_btn))
+                    if probe["hasPosts"]:
+                        views_to_check.append(("Posts", activity_section.locator(POSTS_BUTTON_SELECTOR)))
+                    if probe["hasComments"]:
+                        views_to_check.append(("Comments", activity_section.locator(COMMENTS_BUTTON_SELECTOR)))
                     
                     if not views_to_check:
                          recency_candidates.extend(self._scrape_current_view_times(activity_section))
@@ -128,10 +151,7 @@ class ActivityFilter:
                         and recency['minutes'] <= 50000 
                         and recency['status'] == 'scraped'):
                         
-                        p_name = profile['name'] or ""
-                        profile_obj = Profile(url=url, name=p_name)
-                        if profile.get('first_name'): profile_obj.first_name = profile['first_name']
-                        if profile.get('last_name'): profile_obj.last_name = profile['last_name']
+                        profile_obj = Profile.hydrate_from_row(profile)
                         
                         try:
                             self.db.record_connection_status(url, 'pending')
@@ -173,6 +193,8 @@ class ActivityFilter:
                     logger.error(f"Error processing activity for {url}: {e}")
                     self.db.update_network_activity(url, { "status": "failed" })
             
+            self.db.mark_profiles_scraped_without_activity(skipped_urls)
+            self.db.flush_daily_stats()
             logger.info(f"Batch completed. Processed: {processed_in_batch}")
         
         logger.info(f"Filtering & Sending completed. Sent {requests_sent_session} requests.")
@@ -183,21 +205,13 @@ class ActivityFilter:
         """
         candidates = []
         try:
-            elements_std = activity_section.locator(SUB_DESCRIPTION_SELECTOR)
-            elements_mini = activity_section.locator(MINI_UPDATE_SUB_DESCRIPTION_SELECTOR)
-            
-            count_std = elements_std.count()
-            count_mini = elements_mini.count()
+            # One round-trip per selector instead of count() + nth(i).inner_text() per element
+            texts_std = activity_section.locator(SUB_DESCRIPTION_SELECTOR).all_inner_texts()
+            texts_mini = activity_section.locator(MINI_UPDATE_SUB_DESCRIPTION_SELECTOR).all_inner_texts()
             
-            logger.info(f"Found {count_std} standard timestamps and {count_mini} mini timestamps in current view.")
+            logger.info(f"Found {len(texts_std)} standard timestamps and {len(texts_mini)} mini timestamps in current view.")
             
-            for i in range(count_std):
-                text = elements_std.nth(i).inner_text()
-                parsed = self._parse_recency_from_text(text)
-                candidates.append(parsed)
-
-            for i in range(count_mini):
-                text = elements_mini.nth(i).inner_text()
+            for text in texts_std + texts_mini:
                 parsed = self._parse_recency_from_text(text)
                 candidates.append(parsed)
                 
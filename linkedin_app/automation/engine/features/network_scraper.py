@@ -34,33 +34,33 @@ class NetworkScraper:
 
         def save_batch(profiles: List):
             nonlocal saved_count
-            batch_saved = 0
+            rows = []
             for profile in profiles:
                 try:
                     parts = profile.name.strip().split(' ') if profile.name else []
                     first_name = parts[0] if parts else ""
                     last_name = " ".join(parts[1:]) if len(parts) > 1 else ""
                     
-                    data = {
+                    rows.append({
                         "linkedin_url": profile.url,
                         "name": profile.name,
                         "first_name": first_name,
                         "last_name": last_name,
                         "keywords": [search_kw] if search_kw else [],
                         "location": location if location else profile.location
-                    }
-                    
-                    if self.db.upsert_network_profile(data):
-                        batch_saved += 1
+                    })
                 except Exception as e:
                     logger.error(f"Error saving profile {profile.url}: {e}")
             
+            batch_saved = self.db.upsert_network_profiles(rows)
             saved_count += batch_saved
             if batch_saved > 0:
                 logger.info(f"Progress: Found {len(profiles)} on page. Saved {batch_saved} new. Running total: {saved_count}")
         
         logger.info(f"Navigating to search page for '{keywords}'...")
-        self.searcher.search(criteria, on_page_scraped=save_batch)
+        for page_profiles in self.searcher.search_iter(criteria):
+            if page_profiles:
+                save_batch(page_profiles)
         
         logger.info(f"Scraping completed. Successfully saved {saved_count} profiles to network data.")
         return saved_count
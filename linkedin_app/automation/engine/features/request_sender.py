@@ -1,16 +1,47 @@
 
-from typing import Optional
+import re
+import threading
+from typing import Optional, Tuple, Dict, Any, List
 from loguru import logger
 from ..database.db import DatabaseManager
 from ..browser.browser import BrowserEngine
+from ..browser.workers import run_browser_workers
 from ..connection.connect import ConnectionManager
 from ..utils.models import Profile, ConnectionStatus
+from ..utils.throttler import AdaptiveThrottler
+
+# Number of final statuses buffered before they are written to the DB
+STATUS_FLUSH_EVERY = 25
+
+# Error phrases that map a failed send to a DB status other than 'failed'
+ERROR_STATUS_PATTERN = re.compile(r"already sent|pending|email required", re.IGNORECASE)
+ERROR_STATUSES = {
+    "already sent": "already_connected",
+    "pending": "already_connected",
+    "email required": "skipped",
+}
+
+# Connection history statuses that mean a request no longer needs to be sent
+SETTLED_STATUSES = frozenset({ConnectionStatus.PENDING.value, ConnectionStatus.ACCEPTED.value})
 
 class RequestSender:
-    def __init__(self, browser: BrowserEngine, db: DatabaseManager, connection_manager: ConnectionManager):
+    def __init__(
+        self,
+        browser: BrowserEngine,
+        db: DatabaseManager,
+        connection_manager: ConnectionManager,
+        max_workers: int = 1,
+        throttler: Optional[AdaptiveThrottler] = None,
+    ):
         self.browser = browser
         self.db = db
         self.connection_manager = connection_manager
+        self.max_workers = max(1, max_workers)
+        self.throttler = throttler or AdaptiveThrottler(rate_per_min=4)
+        self._lock = threading.Lock()
+        self._sent_count = 0
+        self._pending_updates: List[Tuple[str, str]] = []
+        self._processed_urls = set()
 
     def execute(self, limit: int = 10):
         """
@@ -26,53 +57,113 @@ class RequestSender:
             
         logger.info(f"Found {len(profiles_data)} candidates for connection requests.")
         
-        sent_count = 0
+        # Skip profiles already requested through another workflow without visiting them
+        known = self.db.bulk_lookup_statuses([p['linkedin_url'] for p in profiles_data])
+        settled = [p['linkedin_url'] for p in profiles_data if known.get(p['linkedin_url']) in SETTLED_STATUSES]
+        if settled:
+            logger.info(f"Skipping {len(settled)} candidates already requested or connected.")
+            self.db.bulk_update_request_status([(url, 'already_connected') for url in settled])
+            settled_urls = set(settled)
+            profiles_data = [p for p in profiles_data if p['linkedin_url'] not in settled_urls]
+            if not profiles_data:
+                return
+        
         total_candidates = len(profiles_data)
+        self._sent_count = 0
+        self._pending_updates = []
+        self._processed_urls = set()
+        
+        # Claim all candidates up front; final statuses are buffered and written in bulk
+        self.db.bulk_update_request_status([(p['linkedin_url'], 'pending') for p in profiles_data])
+        
+        try:
+            workers = min(self.max_workers, total_candidates)
+            if workers > 1:
+                self._send_parallel(profiles_data, workers)
+            else:
+                for idx, p_data in enumerate(profiles_data, 1):
+                    self._record_result(*self._process_one(idx, total_candidates, p_data, self.connection_manager))
+        finally:
+            # Release candidates that were claimed but never attempted so a later run picks them up
+            with self._lock:
+                self._pending_updates.extend(
+                    (p['linkedin_url'], 'not_sent') for p in profiles_data if p['linkedin_url'] not in self._processed_urls
+                )
+                self.db.bulk_update_request_status(self._pending_updates)
+                self._pending_updates = []
+
+        self.db.flush_daily_stats()
+        logger.info(f"Send_Requests completed. Total Sent: {self._sent_count}")
+
+    def _send_parallel(self, profiles_data: List[Dict[str, Any]], workers: int) -> None:
+        """Fan candidates out to several browser workers sharing this session."""
+        total = len(profiles_data)
+        
+        def handle(browser: BrowserEngine, item: Tuple[int, Dict[str, Any]]) -> None:
+            idx, p_data = item
+            connection_manager = self.connection_manager.with_browser(browser)
+            self._record_result(*self._process_one(idx, total, p_data, connection_manager))
+        
+        run_browser_workers(
+            self.browser,
+            enumerate(profiles_data, 1),
+            workers,
+            handle,
+            on_exit=self.db.release_connection,
+        )
+
+    def _process_one(
+        self,
+        idx: int,
+        total: int,
+        p_data: Dict[str, Any],
+        connection_manager: ConnectionManager,
+    ) -> Tuple[str, str]:
+        """Send a single connection request and return its (url, db_status)."""
+        url = p_data['linkedin_url']
+        name = p_data['name']
         
-        for idx, p_data in enumerate(profiles_data, 1):
-            url = p_data['linkedin_url']
-            name = p_data['name']
+        profile = Profile.hydrate_from_row(p_data)
+        
+        progress_info = f"[{idx:02d}/{total:02d}]"
+        logger.info(f"{progress_info} Sending to: {name} (Activity: {p_data.get('recent_activity_minutes')}m)")
+        
+        try:
+            self.throttler.acquire()
+            result = connection_manager.send_connection_request(profile)
+            self.throttler.observe(result.error)
             
-            profile = Profile(url=url, name=name)
-            if p_data.get('first_name'):
-                profile.first_name = p_data['first_name']
-            if p_data.get('last_name'):
-                profile.last_name = p_data['last_name']
+            db_status = 'failed'
+            if result.error:
+                 match = ERROR_STATUS_PATTERN.search(str(result.error))
+                 db_status = ERROR_STATUSES[match.group(0).lower()] if match else 'failed'
+            elif result.status == ConnectionStatus.PENDING:
+                 db_status = 'sent'
+            elif result.status == ConnectionStatus.ACCEPTED:
+                 db_status = 'already_connected'
+            elif result.status == ConnectionStatus.ERROR:
+                 db_status = 'failed'
             
-            progress_info = f"[{idx:02d}/{total_candidates:02d}]"
-            logger.info(f"{progress_info} Sending to: {name} (Activity: {p_data.get('recent_activity_minutes')}m)")
+            if db_status == 'sent':
+                with self._lock:
+                    self._sent_count += 1
+                    sent_count = self._sent_count
+                logger.info(f"Sent successfully! (Session: {sent_count})")
+            else:
+                logger.info(f"Not sent (Status: {db_status})")
             
-            try:
-                self.db.record_connection_status(url, 'pending')
-                result = self.connection_manager.send_connection_request(profile)
-                
-                db_status = 'failed'
-                if result.error:
-                     err_msg = str(result.error).lower()
-                     if "already sent" in err_msg or "pending" in err_msg:
-                         db_status = 'already_connected'
-                     elif "email required" in err_msg:
-                         db_status = 'skipped'
-                     else:
-                         db_status = 'failed'
-                elif result.status == ConnectionStatus.PENDING:
-                     db_status = 'sent'
-                elif result.status == ConnectionStatus.ACCEPTED:
-                     db_status = 'already_connected'
-                elif result.status == ConnectionStatus.ERROR:
-                     db_status = 'failed'
-                
-                self.db.record_connection_status(url, db_status)
-                
-                if db_status == 'sent':
-                    sent_count += 1
-                    logger.info(f"Sent successfully! (Session: {sent_count})")
-                    self.browser.humanizer.random_delay(10000, 20000)
-                else:
-                    logger.info(f"Not sent (Status: {db_status})")
-                
-            except Exception as e:
-                logger.error(f"Error sending request to {url}: {e}")
-                self.db.record_connection_status(url, 'failed')
+        except Exception as e:
+            logger.error(f"Error sending request to {url}: {e}")
+            self.throttler.observe(str(e))
+            db_status = 'failed'
+        
+        return url, db_status
 
-        logger.info(f"Send_Requests completed. Total Sent: {sent_count}")
+    def _record_result(self, url: str, db_status: str) -> None:
+        """Buffer a final status, flushing to the DB every STATUS_FLUSH_EVERY results."""
+        with self._lock:
+            self._pending_updates.append((url, db_status))
+            self._processed_urls.add(url)
+            if len(self._pending_updates) >= STATUS_FLUSH_EVERY:
+                self.db.bulk_update_request_status(self._pending_updates)
+                self._pending_updates = []
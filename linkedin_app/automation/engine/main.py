@@ -4,10 +4,9 @@ LinkedIn Automation Tool - Main Entry Point
 Educational Purpose Only - Do Not Use in Production
 """
 
-import argparse
 import sys
-from pathlib import Path
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, TYPE_CHECKING
 
 from loguru import logger
 
@@ -16,21 +15,21 @@ from .browser.browser import BrowserEngine
 from .auth.login import Authenticator
 from .auth.session import SessionManager
 from .search.search import UserSearch
-from .search.parser import ProfileParser
 from .connection.connect import ConnectionManager
-from .connection.sales_nav_connect import SalesNavConnectionManager
 from .connection.note import NoteComposer
 from .connection.tracker import ConnectionTracker
 from .messaging.followup import FollowUpMessenger
 from .messaging.template import TemplateEngine
 from .messaging.tracker import MessageTracker
 from .utils.models import SearchCriteria
-from .messaging.tracker import MessageTracker
-from .utils.models import SearchCriteria
 from .database.db import DatabaseManager
-from .features.network_scraper import NetworkScraper
-from .features.activity_filter import ActivityFilter
-from .features.request_sender import RequestSender
+from .utils.throttler import AdaptiveThrottler
+
+if TYPE_CHECKING:
+    # Mode-specific features are imported when their run_* method is first used
+    from .features.network_scraper import NetworkScraper
+    from .features.activity_filter import ActivityFilter
+    from .features.request_sender import RequestSender
 
 
 # Configure logging
@@ -61,37 +60,54 @@ class LinkedInBot:
         self.searcher: UserSearch = None
         self.connection_manager: ConnectionManager = None
         self.messenger: FollowUpMessenger = None
+        self.connection_throttler: AdaptiveThrottler = None
         self.database_manager: DatabaseManager = None
+        self.executor: Optional[ThreadPoolExecutor] = None
         
         # Trackers
         self.connection_tracker: ConnectionTracker = None
         self.message_tracker: MessageTracker = None
 
         # Features
-        self.network_scraper: NetworkScraper = None
-        self.activity_filter: ActivityFilter = None
-        self.request_sender: RequestSender = None
+        self.network_scraper: Optional["NetworkScraper"] = None
+        self.activity_filter: Optional["ActivityFilter"] = None
+        self.request_sender: Optional["RequestSender"] = None
+    
+    def _connect_database(self) -> DatabaseManager:
+        """Create and connect the database manager (runs on the bot-io pool)."""
+        database_manager = DatabaseManager(
+            host=self.config.database.host,
+            port=self.config.database.port,
+            database=self.config.database.database,
+            user=self.config.database.user,
+            password=self.config.database.password,
+            schema=self.config.database.schema,
+        )
+        database_manager.connect()
+        # connect() checked out a connection for this pool thread; hand it back
+        database_manager.release_connection()
+        return database_manager
     
     def start(self) -> None:
         """Initialize and start the bot."""
         logger.info("Starting LinkedIn Bot initialization...")
         
+        # Background pool for DB prefetches overlapped with browser work
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bot-io")
+        
+        # Connect to the database in the background while the browser launches;
+        # both are mostly waiting on I/O (TCP/TLS handshakes vs. process spawn)
+        db_future = None
+        if self.config.database.host and self.config.database.user:
+            db_future = self.executor.submit(self._connect_database)
+        
         # Create browser
         self.browser = BrowserEngine(self.config.browser)
         self.browser.start()
         logger.info("Browser Engine started.")
         
-        # Create database manager first
-        if self.config.database.host and self.config.database.user:
-            self.database_manager = DatabaseManager(
-                host=self.config.database.host,
-                port=self.config.database.port,
-                database=self.config.database.database,
-                user=self.config.database.user,
-                password=self.config.database.password,
-                schema=self.config.database.schema,
-            )
-            self.database_manager.connect()
+        if db_future:
+            self.database_manager = db_future.result()
             logger.info("Database manager connected (Sync)")
 
         # Create session manager
@@ -115,6 +131,14 @@ class LinkedInBot:
         # Create note composer
         note_composer = NoteComposer(self.config.messaging.connection_note_template)
         
+        # Pace outbound actions (shared by every connection-sending workflow), with a
+        # human-like random gap from min/max_delay_seconds on top of the paced rate
+        jitter = (self.config.rate_limits.min_delay_seconds, self.config.rate_limits.max_delay_seconds)
+        self.connection_throttler = AdaptiveThrottler(
+            self.config.rate_limits.connections_per_minute,
+            jitter_seconds=jitter,
+        )
+        
         # Create connection manager
         self.connection_manager = ConnectionManager(
             self.browser,
@@ -133,16 +157,14 @@ class LinkedInBot:
             self.message_tracker,
             template_engine,
             self.config.rate_limits.daily_message_limit,
+            throttler=AdaptiveThrottler(self.config.rate_limits.messages_per_minute, jitter_seconds=jitter),
+            max_workers=self.config.rate_limits.parallel_senders,
+            executor=self.executor,
         )
         
         # Create searcher
         self.searcher = UserSearch(self.browser, max_pages=self.config.search.max_pages)
         
-        # Initialize Features
-        self.network_scraper = NetworkScraper(self.browser, self.database_manager)
-        self.activity_filter = ActivityFilter(self.browser, self.database_manager, self.connection_manager)
-        self.request_sender = RequestSender(self.browser, self.database_manager, self.connection_manager)
-        
         logger.info("LinkedIn Bot initialized successfully")
     
     def login(self) -> bool:
@@ -184,16 +206,13 @@ class LinkedInBot:
             if connections_sent >= max_connections:
                 break
             
+            self.connection_throttler.acquire()
             request = self.connection_manager.send_connection_request(profile)
             if request.error:
                 errors += 1
+                self.connection_throttler.observe(request.error)
             else:
                 connections_sent += 1
-            
-            self.browser.humanizer.random_delay(
-                int(self.config.rate_limits.min_delay_seconds * 1000),
-                int(self.config.rate_limits.max_delay_seconds * 1000),
-            )
         
         return {
             "profiles_found": len(result.profiles),
@@ -216,6 +235,9 @@ class LinkedInBot:
         """Stop the bot and cleanup."""
         logger.info("Stopping LinkedIn Bot")
         
+        if self.executor:
+            self.executor.shutdown(wait=True)
+        
         if self.database_manager:
             self.database_manager.close()
         
@@ -226,14 +248,29 @@ class LinkedInBot:
 
     def run_scrapping(self, keywords: str, location: str, start_page: int, pages: int, limit: int) -> None:
         """Run the Scrapping mode."""
+        if not self.network_scraper:
+            from .features.network_scraper import NetworkScraper
+            self.network_scraper = NetworkScraper(self.browser, self.database_manager)
         self.network_scraper.execute(keywords, location, start_page, pages, limit)
 
     def run_filtering(self, target_connections: int) -> None:
         """Run the Filtering mode."""
+        if not self.activity_filter:
+            from .features.activity_filter import ActivityFilter
+            self.activity_filter = ActivityFilter(self.browser, self.database_manager, self.connection_manager)
         self.activity_filter.execute(target_connections)
 
     def run_sending(self, limit: int) -> None:
         """Run the Send_Requests mode."""
+        if not self.request_sender:
+            from .features.request_sender import RequestSender
+            self.request_sender = RequestSender(
+                self.browser,
+                self.database_manager,
+                self.connection_manager,
+                max_workers=self.config.rate_limits.parallel_senders,
+                throttler=self.connection_throttler,
+            )
         self.request_sender.execute(limit)
 
     def run_sales_nav_connection(self, url: str, start_page: int, end_page: int, limit: int, message: Optional[str] = None) -> None:
@@ -243,6 +280,7 @@ class LinkedInBot:
             message = self.config.messaging.connection_note_template
             logger.info("No message provided, using default template from config.")
             
+        from .connection.sales_nav_connect import SalesNavConnectionManager
         mgr = SalesNavConnectionManager(self.browser, self.connection_tracker, self.database_manager)
         mgr.run_automation(url, start_page, end_page, limit, message)
 
@@ -2,13 +2,17 @@
 Follow-up messaging for accepted connections.
 """
 
-from typing import List, Optional
+import threading
+from concurrent.futures import Executor
+from typing import List, Optional, Set
 from datetime import datetime
 
 from loguru import logger
 
 from ..browser.browser import BrowserEngine
+from ..browser.workers import run_browser_workers
 from ..utils.models import Profile, Message
+from ..utils.throttler import AdaptiveThrottler
 from .template import TemplateEngine
 from .tracker import MessageTracker
 
@@ -23,6 +27,41 @@ CONNECTION_CARD = "li.mn-connection-card"
 CONNECTION_LINK = "a.mn-connection-card__link"
 CONNECTION_NAME = "span.mn-connection-card__name"
 
+# Reads url/name of the first `max` connection cards in one round-trip
+EXTRACT_CONNECTIONS_SCRIPT = """
+(sel) => Array.from(document.querySelectorAll(sel.card)).slice(0, sel.max).map((card) => {
+    const link = card.querySelector(sel.link);
+    const name = card.querySelector(sel.name);
+    return {
+        url: link ? link.getAttribute('href') : null,
+        name: name ? (name.textContent || '').trim() : '',
+    };
+})
+"""
+
+# Scrolls until `needed` connection cards are rendered, the list stops growing
+# for `settle` ms, or `timeout` ms elapse. Returns the number of cards loaded.
+AUTO_SCROLL_SCRIPT = """
+async (opts) => {
+    const count = () => document.querySelectorAll(opts.card).length;
+    const started = Date.now();
+    let last = count();
+    let lastGrowth = started;
+    while (count() < opts.needed && Date.now() - started < opts.timeout) {
+        window.scrollBy(0, opts.step);
+        await new Promise((r) => setTimeout(r, opts.interval));
+        const now = count();
+        if (now > last) {
+            last = now;
+            lastGrowth = Date.now();
+        } else if (Date.now() - lastGrowth > opts.settle) {
+            break;
+        }
+    }
+    return count();
+}
+"""
+
 
 class FollowUpMessenger:
     """
@@ -35,11 +74,28 @@ class FollowUpMessenger:
         tracker: MessageTracker,
         template_engine: Optional[TemplateEngine] = None,
         daily_limit: int = 50,
+        throttler: Optional[AdaptiveThrottler] = None,
+        max_workers: int = 1,
+        executor: Optional[Executor] = None,
     ):
         self.browser = browser
         self.tracker = tracker
         self.template_engine = template_engine or TemplateEngine()
         self.daily_limit = daily_limit
+        self.throttler = throttler or AdaptiveThrottler(rate_per_min=6)
+        self.max_workers = max(1, max_workers)
+        self.executor = executor
+    
+    def with_browser(self, browser: BrowserEngine) -> "FollowUpMessenger":
+        """Return a messenger sharing this one's tracker, templates and throttler but driving another browser."""
+        return FollowUpMessenger(
+            browser,
+            self.tracker,
+            self.template_engine,
+            self.daily_limit,
+            throttler=self.throttler,
+            executor=self.executor,
+        )
     
     def send_followup(
         self,
@@ -118,41 +174,65 @@ class FollowUpMessenger:
                 error=str(e),
             )
     
+    def _load_messaged_urls(self) -> Set[str]:
+        """Load all messaged URLs on an executor thread, returning its pool connection afterwards."""
+        try:
+            return self.tracker.get_all_messaged_urls()
+        finally:
+            if self.tracker.db:
+                self.tracker.db.release_connection()
+    
     def get_new_connections(self, limit: int = 20) -> List[Profile]:
         """
         Get newly accepted connections that haven't been messaged.
         """
         logger.info("Fetching new connections")
         
+        # Load the messaged set while the page loads and scrolls
+        messaged_future = self.executor.submit(self._load_messaged_urls) if self.executor else None
+        
         self.browser.navigate(CONNECTIONS_PAGE)
         self.browser.humanizer.random_delay(5000, 10000)
         
-        # Scroll to load connections
-        for _ in range(3):
-            self.browser.scroll("down", 500)
-            self.browser.humanizer.random_delay(5000, 10000)
-        
         profiles = []
         try:
-            cards = self.browser.get_all_elements(CONNECTION_CARD)
-            for card in cards[:limit * 2]:
-                try:
-                    link = card.query_selector(CONNECTION_LINK)
-                    if not link: continue
-                    url = link.get_attribute("href")
-                    if not url: continue
-                    if self.tracker.is_already_messaged(url): continue
-                    
-                    name_el = card.query_selector(CONNECTION_NAME)
-                    name = name_el.text_content().strip() if name_el else ""
-                    
-                    profiles.append(Profile(
-                        url=url,
-                        name=name,
-                        first_name=name.split()[0] if name else "",
-                    ))
-                    if len(profiles) >= limit: break
-                except: continue
+            # Scroll until enough cards are loaded instead of a fixed number of passes
+            loaded = self.browser.page.evaluate(AUTO_SCROLL_SCRIPT, {
+                "card": CONNECTION_CARD,
+                "needed": limit * 2,
+                "step": 800,
+                "interval": 400,
+                "settle": 3000,
+                "timeout": 30000,
+            })
+            logger.debug(f"Loaded {loaded} connection cards")
+            
+            cards = self.browser.page.evaluate(EXTRACT_CONNECTIONS_SCRIPT, {
+                "card": CONNECTION_CARD,
+                "link": CONNECTION_LINK,
+                "name": CONNECTION_NAME,
+                "max": limit * 2,
+            })
+            if messaged_future:
+                messaged = messaged_future.result()
+            else:
+                messaged = self.tracker.get_messaged_urls([card["url"] for card in cards if card["url"]])
+            # Cards are plain dicts from EXTRACT_CONNECTIONS_SCRIPT, so no browser errors can surface here
+            scraped_at = datetime.now()
+            for card in cards:
+                url = card["url"]
+                if not url: continue
+                if url in messaged: continue
+                
+                name = card["name"]
+                
+                profiles.append(Profile(
+                    url=url,
+                    name=name,
+                    first_name=name.split()[0] if name else "",
+                    scraped_at=scraped_at,
+                ))
+                if len(profiles) >= limit: break
         except Exception as e:
             logger.error(f"Failed to get connections: {e}")
         
@@ -163,12 +243,42 @@ class FollowUpMessenger:
         Find and message new connections.
         """
         connections = self.get_new_connections(limit=limit)
+        workers = min(self.max_workers, len(connections))
+        if workers > 1:
+            return self._process_parallel(connections, workers)
+        
         messages = []
         for profile in connections:
             # if self.tracker.get_today_count() >= self.daily_limit:
             #     break
+            self.throttler.acquire()
             msg = self.send_followup(profile)
+            self.throttler.observe(msg.error)
             messages.append(msg)
             if self.browser.humanizer.should_take_break(len(messages)):
                 self.browser.humanizer.take_break()
         return messages
+    
+    def _process_parallel(self, connections: List[Profile], workers: int) -> List[Message]:
+        """Message connections from several browser workers sharing this session."""
+        messages = []
+        lock = threading.Lock()
+        
+        def handle(browser: BrowserEngine, profile: Profile) -> None:
+            self.throttler.acquire()
+            msg = self.with_browser(browser).send_followup(profile)
+            self.throttler.observe(msg.error)
+            with lock:
+                messages.append(msg)
+                sent = len(messages)
+            if browser.humanizer.should_take_break(sent):
+                browser.humanizer.take_break()
+        
+        run_browser_workers(
+            self.browser,
+            connections,
+            workers,
+            handle,
+            on_exit=self.tracker.db.release_connection,
+        )
+        return messages
@@ -4,13 +4,42 @@ Message template engine.
 
 import random
 import re
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple
 
 from loguru import logger
 
 from ..utils.models import Profile
 
 
+# Matches {key} and {{key}} placeholders
+PLACEHOLDER_PATTERN = re.compile(r"\{\{?(\w+)\}?\}")
+
+FALLBACKS = {
+    "first_name": "there",
+    "company": "your company",
+    "title": "your work",
+    "location": "your area",
+    "name": "friend",
+}
+
+
+@lru_cache(maxsize=512)
+def _render_compiled(template: str, variables: Tuple[Tuple[str, str], ...]) -> str:
+    """Render a template against a sorted tuple of variable items in one regex pass."""
+    values = dict(variables)
+    
+    def replace(match: "re.Match") -> str:
+        key = match.group(1)
+        if key not in values:
+            # Leave unknown placeholders untouched
+            return match.group(0)
+        # Use fallback if value is empty
+        return values[key] or FALLBACKS.get(key, "")
+    
+    return PLACEHOLDER_PATTERN.sub(replace, template)
+
+
 class TemplateEngine:
     """
     Renders message templates with dynamic variables.
@@ -66,32 +95,11 @@ class TemplateEngine:
     
     def _substitute(self, template: str, variables: Dict[str, str]) -> str:
         """Substitute variables in the template."""
-        result = template
-        
-        for key, value in variables.items():
-            patterns = [
-                f"{{{key}}}",
-                f"{{{{{key}}}}}",
-            ]
-            
-            for pattern in patterns:
-                if pattern in result:
-                    # Use fallback if value is empty
-                    replacement = value or self._get_fallback(key)
-                    result = result.replace(pattern, replacement)
-        
-        return result
+        return _render_compiled(template, tuple(sorted(variables.items())))
     
     def _get_fallback(self, key: str) -> str:
         """Get fallback value for empty variables."""
-        fallbacks = {
-            "first_name": "there",
-            "company": "your company",
-            "title": "your work",
-            "location": "your area",
-            "name": "friend",
-        }
-        return fallbacks.get(key, "")
+        return FALLBACKS.get(key, "")
     
     def add_template(self, template: str) -> None:
         """Add a new template to the rotation."""
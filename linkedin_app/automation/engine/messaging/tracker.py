@@ -5,7 +5,7 @@ Message tracking and history.
 import json
 from datetime import datetime, date
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Set
 
 from loguru import logger
 
@@ -35,9 +35,9 @@ class MessageTracker:
             template=message.template_used,
             error=message.error
         )
-        self.db.record_daily_stat("messages_sent")
+        self.db.queue_daily_stat("messages_sent")
         if message.error:
-            self.db.record_daily_stat("errors")
+            self.db.queue_daily_stat("errors")
         
         logger.debug(f"Recorded message in database to: {message.recipient_url}")
     
@@ -45,6 +45,14 @@ class MessageTracker:
         """Check if we've already messaged this profile in the database."""
         return self.db.is_already_messaged(profile_url)
     
+    def get_messaged_urls(self, profile_urls: List[str]) -> Set[str]:
+        """Get which of the given profiles were already messaged, in one lookup."""
+        return self.db.get_messaged_urls(profile_urls)
+    
+    def get_all_messaged_urls(self) -> Set[str]:
+        """Get every profile already messaged, for prefetching before a scrape."""
+        return self.db.fetch_messaged_urls()
+    
     def get_today_count(self) -> int:
         """Get the number of messages sent today from the database."""
         return self.db.get_daily_stat("messages_sent")
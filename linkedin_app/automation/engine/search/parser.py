@@ -3,7 +3,7 @@ Profile parsing from LinkedIn search results.
 """
 
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 from loguru import logger
@@ -23,6 +23,62 @@ PROFILE_HEADLINE = "div.t-14.t-black.t-normal"
 # Location: div with t-14, t-normal classes that comes after headline (typically contains city, state)
 PROFILE_LOCATION = "div.t-14.t-normal"
 
+# Selectors for a single profile page
+PROFILE_PAGE_NAME = "h1.text-heading-xlarge"
+PROFILE_PAGE_HEADLINE = "div.text-body-medium"
+PROFILE_PAGE_LOCATION = "span.text-body-small:has-text('•')"
+
+# Selectors handed to the in-page extraction script
+RESULT_SELECTORS = {
+    "item": SEARCH_RESULT_ITEM,
+    "link": PROFILE_LINK,
+    "name": "span[aria-hidden='true']",
+    "headline": PROFILE_HEADLINE,
+    "location": PROFILE_LOCATION,
+}
+
+# Reads url/name/headline/location of one result item in a single round-trip; null without a profile link
+EXTRACT_ITEM_SCRIPT = """
+(item, sel) => {
+    const text = (el) => ((el && el.textContent) || '').trim();
+    // The main profile link carries miniProfileUrn; mutual-connection links do not
+    const link = Array.from(item.querySelectorAll(sel.link)).find((a) => {
+        const href = a.getAttribute('href') || '';
+        return href.includes('/in/') && href.includes('miniProfileUrn');
+    });
+    if (!link) return null;
+    // Location typically contains commas or looks like "City, State" or "City, Country"
+    const location = Array.from(item.querySelectorAll(sel.location), text)
+        .find((t) => t && (t.includes(',') || t.split(/\\s+/).length <= 3));
+    return {
+        url: link.getAttribute('href'),
+        name: text(link.querySelector(sel.name)),
+        headline: text(item.querySelector(sel.headline)),
+        location: location || '',
+    };
+}
+"""
+
+# Extracts every result item on the page in one round-trip; items without a profile link map to null
+EXTRACT_RESULTS_SCRIPT = f"""
+(sel) => {{
+    const read = {EXTRACT_ITEM_SCRIPT.strip()};
+    return Array.from(document.querySelectorAll(sel.item), (item) => read(item, sel));
+}}
+"""
+
+# Headline patterns, tried in order
+# Common patterns: "Title at Company", "Title @ Company"
+COMPANY_PATTERNS = [
+    re.compile(r" at (.+?)(?:\s*[|·•]|$)", re.IGNORECASE),
+    re.compile(r" @ (.+?)(?:\s*[|·•]|$)", re.IGNORECASE),
+    re.compile(r"(?:^|\|)\s*(.+?)(?:\s*[|·•]|$)", re.IGNORECASE),
+]
+TITLE_PATTERNS = [
+    re.compile(r"^(.+?)\s+(?:at|@)\s+", re.IGNORECASE),
+    re.compile(r"^(.+?)(?:\s*[|·•])", re.IGNORECASE),
+]
+
 
 class ProfileParser:
     """
@@ -32,23 +88,36 @@ class ProfileParser:
     def __init__(self, browser: BrowserEngine):
         self.browser = browser
     
-    def parse_search_results(self) -> List[Profile]:
+    def parse_search_results(self, bulk: bool = True) -> List[Profile]:
         """
         Parse profiles from the current search results page.
         
+        Args:
+            bulk: Extract all items in one page-wide evaluate. When False, each
+                item is read through its own element handle.
+        
         Returns:
             List of Profile objects.
         """
         profiles = []
+        # One timestamp for the whole page
+        scraped_at = datetime.now()
         
         try:
-            # Get all search result items
+            if bulk:
+                # Extract all result items in a single evaluate
+                items = self.browser.page.evaluate(EXTRACT_RESULTS_SCRIPT, RESULT_SELECTORS)
+                logger.debug(f"Found {len(items)} search result items")
+                return [self._build_profile(data, scraped_at) for data in items if data]
+            
+            # Per-item fallback. This stays serial: the sync Playwright page is
+            # bound to this thread, so handles cannot be read from a thread pool
             items = self.browser.get_all_elements(SEARCH_RESULT_ITEM)
             logger.debug(f"Found {len(items)} search result items")
             
             for i, item in enumerate(items):
                 try:
-                    profile = self._parse_result_item(item)
+                    profile = self._parse_result_item(item, scraped_at)
                     if profile:
                         profiles.append(profile)
                 except Exception as e:
@@ -60,79 +129,43 @@ class ProfileParser:
         
         return profiles
     
-    def _parse_result_item(self, item) -> Optional[Profile]:
+    def _parse_result_item(self, item, scraped_at: Optional[datetime] = None) -> Optional[Profile]:
         """Parse a single search result item."""
+        from playwright.sync_api import Error as PlaywrightError
         try:
-            # Get profile URL - look for the main profile link (not mutual connections links)
-            # Use query_selector_all on the item (ElementHandle)
-            link_elements = item.query_selector_all(PROFILE_LINK)
-            link_element = None
-            url = None
-            
-            # Find the main profile link (usually the first one with /in/ in href)
-            for link in link_elements:
-                href = link.get_attribute("href") or ""
-                if "/in/" in href and "miniProfileUrn" in href:
-                    link_element = link
-                    url = href
-                    break
-            
-            if not link_element or not url:
-                return None
-            
-            # Clean URL (remove query parameters)
-            url = self._clean_profile_url(url)
-            
-            # Get name - look for span with aria-hidden='true' within the profile link
-            name = ""
-            name_element = link_element.query_selector("span[aria-hidden='true']")
-            if name_element:
-                name = name_element.text_content() or ""
-                name = name.strip()
-            
-            # Get headline - find div with t-14 t-black t-normal classes
-            # This appears in the result item, typically after the name section
-            headline = ""
-            headline_elements = item.query_selector_all(PROFILE_HEADLINE)
-            # Usually the first one is the headline (others might be badges or other text)
-            if headline_elements:
-                headline = headline_elements[0].text_content() or ""
-                headline = headline.strip()
-            
-            # Get location - find div with t-14 t-normal that comes after headline
-            # Look for the one that contains location-like text (has comma or city/state pattern)
-            location = ""
-            location_elements = item.query_selector_all(PROFILE_LOCATION)
-            for loc_elem in location_elements:
-                loc_text = loc_elem.text_content() or ""
-                loc_text = loc_text.strip()
-                # Location typically contains commas or looks like "City, State" or "City, Country"
-                if loc_text and ("," in loc_text or len(loc_text.split()) <= 3):
-                    location = loc_text
-                    break
-            
-            # Extract first name and company from headline
-            first_name, last_name = self._split_name(name)
-            company = self._extract_company(headline)
-            if company == "" or "Engineer" in company:
-                company = "your company"
-            title = self._extract_title(headline)
-            
-            return Profile(
-                url=url,
-                name=name,
-                first_name=first_name,
-                last_name=last_name,
-                headline=headline,
-                company=company,
-                location=location,
-                title=title,
-                scraped_at=datetime.now(),
-            )
-            
-        except Exception as e:
+            # Read all fields in one round-trip instead of a query per element
+            data = item.evaluate(EXTRACT_ITEM_SCRIPT, RESULT_SELECTORS)
+        except PlaywrightError as e:
             logger.debug(f"Error parsing result item: {e}")
             return None
+        
+        if not data:
+            return None
+        return self._build_profile(data, scraped_at)
+    
+    def _build_profile(self, data: Dict[str, str], scraped_at: Optional[datetime] = None) -> Profile:
+        """Build a Profile from raw result-item fields (url, name, headline, location)."""
+        name = data["name"]
+        headline = data["headline"]
+        
+        # Extract first name and company from headline
+        first_name, last_name = self._split_name(name)
+        company = self._extract_company(headline)
+        if company == "" or "Engineer" in company:
+            company = "your company"
+        title = self._extract_title(headline)
+        
+        return Profile(
+            url=self._clean_profile_url(data["url"]),
+            name=name,
+            first_name=first_name,
+            last_name=last_name,
+            headline=headline,
+            company=company,
+            location=data["location"],
+            title=title,
+            scraped_at=scraped_at or datetime.now(),
+        )
     
     def parse_profile_page(self) -> Optional[Profile]:
         """
@@ -144,14 +177,16 @@ class ProfileParser:
         try:
             url = self.browser.get_current_url()
             
-            # Get name from the profile page
-            name = self.browser.get_text("h1.text-heading-xlarge")
+            # Name and headline are plain CSS, so read both in one round-trip
+            fields = self.browser.batch_extract({
+                "name": (PROFILE_PAGE_NAME, None),
+                "headline": (PROFILE_PAGE_HEADLINE, None),
+            })
+            name = fields["name"] or ""
+            headline = fields["headline"] or ""
             
-            # Get headline
-            headline = self.browser.get_text("div.text-body-medium")
-            
-            # Get location
-            location = self.browser.get_text("span.text-body-small:has-text('•')")
+            # Location needs Playwright's :has-text, so it is read on its own
+            location = self.browser.get_text(PROFILE_PAGE_LOCATION)
             
             first_name, last_name = self._split_name(name)
             company = self._extract_company(headline)
@@ -177,35 +212,18 @@ class ProfileParser:
     
     def _clean_profile_url(self, url: str) -> str:
         """Clean a profile URL by removing query parameters."""
-        # Remove query parameters
-        if "?" in url:
-            url = url.split("?")[0]
-        
-        # Ensure it ends without trailing slash
-        url = url.rstrip("/")
-        
-        return url
+        # Remove query parameters, then any trailing slash
+        return url.partition("?")[0].rstrip("/")
     
     def _split_name(self, full_name: str) -> tuple:
         """Split full name into first and last name."""
-        parts = full_name.strip().split()
-        if len(parts) >= 2:
-            return parts[0], " ".join(parts[1:])
-        elif len(parts) == 1:
-            return parts[0], ""
-        return "", ""
+        first, _, rest = full_name.strip().partition(" ")
+        return first, rest.lstrip()
     
     def _extract_company(self, headline: str) -> str:
         """Extract company name from headline."""
-        # Common patterns: "Title at Company", "Title @ Company"
-        patterns = [
-            r" at (.+?)(?:\s*[|·•]|$)",
-            r" @ (.+?)(?:\s*[|·•]|$)",
-            r"(?:^|\|)\s*(.+?)(?:\s*[|·•]|$)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, headline, re.IGNORECASE)
+        for pattern in COMPANY_PATTERNS:
+            match = pattern.search(headline)
             if match:
                 return match.group(1).strip()
         
@@ -213,14 +231,8 @@ class ProfileParser:
     
     def _extract_title(self, headline: str) -> str:
         """Extract job title from headline."""
-        # Common patterns: "Title at Company"
-        patterns = [
-            r"^(.+?)\s+(?:at|@)\s+",
-            r"^(.+?)(?:\s*[|·•])",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, headline, re.IGNORECASE)
+        for pattern in TITLE_PATTERNS:
+            match = pattern.search(headline)
             if match:
                 return match.group(1).strip()
         
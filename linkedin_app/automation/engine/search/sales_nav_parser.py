@@ -3,7 +3,8 @@ Profile parsing from LinkedIn Sales Navigator search results.
 """
 
 import re
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from loguru import logger
@@ -22,6 +23,87 @@ PROFILE_LOCATION = "span[data-anonymize='location']"
 PROFILE_COMPANY = "a[data-anonymize='company-name']"
 LEAD_INDICATOR = "div[data-x-search-result='LEAD']"
 
+# Headline patterns, compiled once for the per-item parse loop
+_COMPANY_RE = re.compile(r" (?:at|@) (.+?)(?:\s*[|·•]|$)", re.IGNORECASE)
+_TITLE_AT_RE = re.compile(r"^(.+?)\s+(?:at|@)\s+", re.IGNORECASE)
+
+# Selectors handed to the in-page extraction script
+RESULT_SELECTORS = {
+    "item": SEARCH_RESULT_ITEM,
+    "lead": LEAD_INDICATOR,
+    "link": PROFILE_LINK,
+    "name": PROFILE_NAME,
+    "headline": PROFILE_HEADLINE,
+    "location": PROFILE_LOCATION,
+    "company": PROFILE_COMPANY,
+}
+
+# Reads the fields of one result item in-page; null when it is not a lead
+EXTRACT_ITEM_SCRIPT = """
+(item, sel) => {
+    if (!item.querySelector(sel.lead)) return null;
+    const link = item.querySelector(sel.link);
+    if (!link) return null;
+    const text = (el) => ((el && el.textContent) || '').trim();
+    return {
+        url: link.getAttribute('href') || '',
+        name: text(link.querySelector(sel.name) || link),
+        headline: text(item.querySelector(sel.headline)),
+        location: text(item.querySelector(sel.location)),
+        company: text(item.querySelector(sel.company)),
+    };
+}
+"""
+
+# Extracts every result item on the page in one round-trip; non-lead items map to null
+EXTRACT_RESULTS_SCRIPT = f"""
+(sel) => {{
+    const read = {EXTRACT_ITEM_SCRIPT.strip()};
+    return Array.from(document.querySelectorAll(sel.item), (item) => read(item, sel));
+}}
+"""
+
+
+# Size of the memo caches for the pure string helpers below; result pages
+# overlap across scrolls and pages, and many leads share a headline
+PARSE_CACHE_SIZE = 2048
+
+
+def _text(data: Dict[str, str], key: str) -> str:
+    """Stripped text of an extracted field, or "" when it is missing or empty."""
+    value = data.get(key)
+    return value.strip() if value else ""
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _clean_profile_url(url: str) -> str:
+    """Clean a profile URL."""
+    return url.partition("?")[0].rstrip("/")
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _split_name(full_name: str) -> Tuple[str, str]:
+    """Split full name into first and last name."""
+    first, _, rest = full_name.strip().partition(" ")
+    return first, rest.lstrip()
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _extract_company(headline: str) -> str:
+    """Extract company name from headline."""
+    match = _COMPANY_RE.search(headline)
+    return match.group(1).strip() if match else ""
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _extract_title(headline: str) -> str:
+    """Extract job title from headline."""
+    match = _TITLE_AT_RE.search(headline)
+    if match:
+        return match.group(1).strip()
+    
+    return headline.split("|")[0].strip() if headline else ""
+
 
 class SalesNavParser:
     """
@@ -31,26 +113,43 @@ class SalesNavParser:
     def __init__(self, browser: BrowserEngine):
         self.browser = browser
     
-    def parse_search_results(self) -> List[Profile]:
+    def parse_search_results(self, bulk: bool = True) -> List[Profile]:
         """
         Parse profiles from the current Sales Navigator search results page.
         
+        Args:
+            bulk: Extract all items in one page-wide evaluate. When False, each
+                item is read through its own element handle.
+        
         Returns:
             List of Profile objects.
         """
         profiles = []
+        # One timestamp for the whole page
+        scraped_at = datetime.now()
         
         try:
             # Wait for search results to load
             self.browser.wait_for_element(SEARCH_RESULT_ITEM, timeout=20000)
             
-            # Get all search result items
-            items = self.browser.get_all_elements(SEARCH_RESULT_ITEM)
+            if bulk:
+                # Extract all result items in a single evaluate
+                items = self.browser.page.evaluate(EXTRACT_RESULTS_SCRIPT, RESULT_SELECTORS)
+            else:
+                # Per-item fallback. This stays serial: the sync Playwright page is
+                # bound to this thread, so handles cannot be read from a thread pool
+                items = [
+                    element.evaluate(EXTRACT_ITEM_SCRIPT, RESULT_SELECTORS)
+                    for element in self.browser.get_all_elements(SEARCH_RESULT_ITEM)
+                ]
             logger.debug(f"Found {len(items)} Sales Navigator search result items")
             
-            for i, item in enumerate(items):
+            for i, data in enumerate(items):
+                if not data:
+                    logger.debug(f"Sales Nav result item {i} is not a lead, skipping.")
+                    continue
                 try:
-                    profile = self._parse_result_item(item)
+                    profile = self._build_profile(data, scraped_at)
                     if profile:
                         profiles.append(profile)
                 except Exception as e:
@@ -62,115 +161,57 @@ class SalesNavParser:
         
         return profiles
     
-    def _parse_result_item(self, item) -> Optional[Profile]:
+    def _parse_result_item(self, item, scraped_at: Optional[datetime] = None) -> Optional[Profile]:
         """Parse a single Sales Navigator search result item."""
+        from playwright.sync_api import Error as PlaywrightError
         try:
-            # First, verify if this is actually a lead result
-            if not item.query_selector(LEAD_INDICATOR):
-                logger.debug("Item does not have a lead indicator, skipping.")
+            # Read all fields in one round-trip instead of a query per field
+            data = item.evaluate(EXTRACT_ITEM_SCRIPT, RESULT_SELECTORS)
+            if not data:
+                logger.debug("Item is not a lead result, skipping.")
                 return None
-
-            # Get profile URL
-            link_element = item.query_selector(PROFILE_LINK)
-            if not link_element:
-                return None
-            
-            url = link_element.get_attribute("href") or ""
-            if not url:
-                return None
-            
-            # Clean URL
-            url = self._clean_profile_url(url)
-            
-            # Get name - usually inside the link in a span
-            name_element = link_element.query_selector(PROFILE_NAME)
-            if name_element:
-                name = name_element.text_content() or ""
-            else:
-                name = link_element.text_content() or ""
-            name = name.strip()
-            
-            # Get headline
-            headline = ""
-            headline_element = item.query_selector(PROFILE_HEADLINE)
-            if headline_element:
-                headline = headline_element.text_content() or ""
-                headline = headline.strip()
-            
-            # Get location
-            location = ""
-            location_element = item.query_selector(PROFILE_LOCATION)
-            if location_element:
-                location = location_element.text_content() or ""
-                location = location.strip()
-            
-            # Get company
-            company = ""
-            company_element = item.query_selector(PROFILE_COMPANY)
-            if company_element:
-                company = company_element.text_content() or ""
-                company = company.strip()
-            
-            # Extract first name
-            first_name, last_name = self._split_name(name)
-            
-            # If headline is missing, use title if available
-            title = headline
             
-            return Profile(
-                url=url,
-                name=name,
-                first_name=first_name,
-                last_name=last_name,
-                headline=headline,
-                company=company,
-                location=location,
-                title=title,
-                scraped_at=datetime.now(),
-            )
+            return self._build_profile(data, scraped_at)
             
-        except Exception as e:
+        except PlaywrightError as e:
             logger.debug(f"Error parsing Sales Nav result item: {e}")
             return None
     
+    def _build_profile(self, data: Dict[str, str], scraped_at: Optional[datetime] = None) -> Optional[Profile]:
+        """Build a Profile from raw result-item fields (url, name, headline, location, company)."""
+        url = data.get("url") or ""
+        if not url:
+            return None
+        
+        name = _text(data, "name")
+        headline = _text(data, "headline")
+        first_name, last_name = self._split_name(name)
+        
+        return Profile(
+            url=self._clean_profile_url(url),
+            name=name,
+            first_name=first_name,
+            last_name=last_name,
+            headline=headline,
+            company=_text(data, "company"),
+            location=_text(data, "location"),
+            # If headline is missing, use title if available
+            title=headline,
+            scraped_at=scraped_at or datetime.now(),
+        )
+    
     def _clean_profile_url(self, url: str) -> str:
         """Clean a profile URL."""
-        if "?" in url:
-            url = url.split("?")[0]
-        return url.rstrip("/")
+        return _clean_profile_url(url)
     
-    def _split_name(self, full_name: str) -> tuple:
+    def _split_name(self, full_name: str) -> Tuple[str, str]:
         """Split full name into first and last name."""
-        parts = full_name.strip().split()
-        if len(parts) >= 2:
-            return parts[0], " ".join(parts[1:])
-        elif len(parts) == 1:
-            return parts[0], ""
-        return "", ""
+        return _split_name(full_name)
     
     def _extract_company(self, headline: str) -> str:
         """Extract company name from headline."""
-        patterns = [
-            r" at (.+?)(?:\s*[|·•]|$)",
-            r" @ (.+?)(?:\s*[|·•]|$)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, headline, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        
-        return ""
+        return _extract_company(headline)
     
     def _extract_title(self, headline: str) -> str:
         """Extract job title from headline."""
-        patterns = [
-            r"^(.+?)\s+(?:at|@)\s+",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, headline, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-        
-        return headline.split("|")[0].strip() if headline else ""
+        return _extract_title(headline)
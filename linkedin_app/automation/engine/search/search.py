@@ -3,18 +3,51 @@ LinkedIn user search functionality.
 """
 
 import re
+import time
 import urllib.parse
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
 
 from loguru import logger
 
 from ..browser.browser import BrowserEngine
 from ..utils.models import Profile, SearchCriteria, SearchResult
-from .parser import ProfileParser
+from .parser import ProfileParser, SEARCH_RESULT_ITEM
 from .pagination import PaginationHandler
 
 
+# (filter prefix, SearchCriteria attribute) pairs joined into the "filters" parameter, in order
+SEARCH_FILTERS = (
+    ("currentFunction->title", "job_title"),
+    ("currentCompany", "company"),
+    ("industry", "industry"),
+)
+
+# Scrolls the results page and resets the stability marker read by RESULTS_SETTLED_SCRIPT
+SCROLL_RESULTS_SCRIPT = """
+(amount) => {
+    window.__resultCount = -1;
+    window.scrollBy({top: amount, behavior: 'smooth'});
+}
+"""
+
+# Polled by wait_for_function: truthy once the result count is unchanged between two polls
+RESULTS_SETTLED_SCRIPT = """
+(sel) => {
+    const n = document.querySelectorAll(sel).length;
+    const settled = n > 0 && window.__resultCount === n;
+    window.__resultCount = n;
+    if (!settled) return false;
+    const bottom = window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 2;
+    return {count: n, bottom: bottom};
+}
+"""
+
+# Poll interval and per-scroll ceiling for the settle wait, in milliseconds
+RESULTS_SETTLE_POLL_MS = 500
+RESULTS_SETTLE_TIMEOUT_MS = 5000
+
+
 class UserSearch:
     """
     Search for LinkedIn users based on criteria.
@@ -42,12 +75,51 @@ class UserSearch:
         Returns:
             SearchResult with found profiles.
         """
-        start_time = datetime.now()
-        logger.info(f"Starting user search with criteria: {criteria}")
+        start_time = time.monotonic()
         
         profiles: List[Profile] = []
         pages_scraped = 0
         
+        for new_profiles in self.search_iter(criteria):
+            pages_scraped += 1
+            profiles.extend(new_profiles)
+            
+            if on_page_scraped and new_profiles:
+                on_page_scraped(new_profiles)
+        
+        duration = time.monotonic() - start_time
+        
+        result = SearchResult(
+            criteria=criteria,
+            profiles=profiles,
+            total_found=len(profiles),
+            pages_scraped=pages_scraped,
+            searched_at=datetime.now(),
+            duration_seconds=duration,
+        )
+        
+        logger.info(f"Search completed: {len(profiles)} profiles found in {duration:.2f}s")
+        return result
+    
+    def search_iter(self, criteria: SearchCriteria) -> Iterator[List[Profile]]:
+        """
+        Search for profiles, yielding the new profiles of each page as it is scraped.
+        
+        One list is yielded per page (empty when the page only had duplicates),
+        so callers can persist results page by page without holding the whole
+        run in memory. Stopping iteration early stops paging.
+        
+        Args:
+            criteria: Search criteria to use.
+            
+        Yields:
+            Lists of profiles not seen before, one per page.
+        """
+        logger.info(f"Starting user search with criteria: {criteria}")
+        
+        found = 0
+        pages_scraped = 0
+        
         # Build search URL
         search_url = self._build_search_url(criteria)
         logger.debug(f"Search URL: {search_url}")
@@ -62,30 +134,32 @@ class UserSearch:
             current_page_num = criteria.page + pages_scraped - 1
             logger.info(f"Processing page {current_page_num} (Iteration {pages_scraped})")
             
-            # Scroll to load all results on the page
-            self._scroll_to_load_results()
+            # Scroll to load results on the page, stopping early once enough are visible
+            remaining = criteria.max_results - found if criteria.max_results else None
+            self._scroll_to_load_results(remaining)
             
             # Parse profiles from current page
             page_profiles = self.parser.parse_search_results()
             
-            # Filter duplicates
+            # Filter duplicates; a grown set means the URL was new (one hash per profile)
             new_profiles = []
+            seen = self._seen_urls
             for profile in page_profiles:
-                if profile.url not in self._seen_urls:
-                    self._seen_urls.add(profile.url)
+                before = len(seen)
+                seen.add(profile.url)
+                if len(seen) != before:
                     new_profiles.append(profile)
             
-            profiles.extend(new_profiles)
             logger.info(f"Found {len(new_profiles)} new profiles on page {pages_scraped}")
             
-            if on_page_scraped and new_profiles:
-                on_page_scraped(new_profiles)
-            
             # Check if we've reached max results
-            if criteria.max_results and len(profiles) >= criteria.max_results:
-                profiles = profiles[:criteria.max_results]
+            if criteria.max_results and found + len(new_profiles) >= criteria.max_results:
+                yield new_profiles[:criteria.max_results - found]
                 break
             
+            found += len(new_profiles)
+            yield new_profiles
+            
             # Check for next page
             has_next = self.pagination.has_next_page()
             if not has_next:
@@ -95,61 +169,56 @@ class UserSearch:
             # Go to next page
             self.pagination.go_to_next_page()
             self.browser.humanizer.random_delay(500, 1000)
-        
-        duration = (datetime.now() - start_time).total_seconds()
-        
-        result = SearchResult(
-            criteria=criteria,
-            profiles=profiles,
-            total_found=len(profiles),
-            pages_scraped=pages_scraped,
-            searched_at=datetime.now(),
-            duration_seconds=duration,
-        )
-        
-        logger.info(f"Search completed: {len(profiles)} profiles found in {duration:.2f}s")
-        return result
     
     def _build_search_url(self, criteria: SearchCriteria) -> str:
         """Build the LinkedIn search URL from criteria."""
-        params = {}
+        quote = urllib.parse.quote_plus
+        params = []
         
         if criteria.keywords:
-            params["keywords"] = criteria.keywords
+            params.append(f"keywords={quote(criteria.keywords)}")
 
-        params["network"] = criteria.network
-        params["page"] = criteria.page
-        # LinkedIn uses specific filter parameters
-        filters = []
-        
-        if criteria.job_title:
-            filters.append(f"currentFunction->title:{criteria.job_title}")
-        
-        if criteria.company:
-            filters.append(f"currentCompany:{criteria.company}")
+        params.append(f"network={quote(criteria.network)}")
+        params.append(f"page={criteria.page}")
         
         if criteria.location:
-            params["geoUrn"] = criteria.location
-        
-        if criteria.industry:
-            filters.append(f"industry:{criteria.industry}")
+            params.append(f"geoUrn={quote(criteria.location)}")
         
+        # LinkedIn uses specific filter parameters
+        filters = ",".join(
+            f"{prefix}:{getattr(criteria, attr)}" for prefix, attr in SEARCH_FILTERS if getattr(criteria, attr)
+        )
         if filters:
-            params["filters"] = ",".join(filters)
+            params.append(f"filters={quote(filters)}")
         
-        # Build URL
-        query_string = urllib.parse.urlencode(params)
-        return f"{self.BASE_SEARCH_URL}?{query_string}"
+        return f"{self.BASE_SEARCH_URL}?{'&'.join(params)}"
     
-    def _scroll_to_load_results(self) -> None:
-        """Scroll through the page to load all lazy-loaded results."""
-        scroll_count = 0
+    def _scroll_to_load_results(self, target: Optional[int] = None) -> None:
+        """
+        Scroll through the page until lazy-loaded results stop changing.
+        
+        Args:
+            target: Stop as soon as this many results are loaded, if given.
+        """
         max_scrolls = 5
         
-        while scroll_count < max_scrolls:
-            self.browser.scroll("down", 400)
-            self.browser.humanizer.random_delay(5000, 10000)
-            scroll_count += 1
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        for _ in range(max_scrolls):
+            self.browser.page.evaluate(SCROLL_RESULTS_SCRIPT, 400)
+            try:
+                state = self.browser.page.wait_for_function(
+                    RESULTS_SETTLED_SCRIPT,
+                    arg=SEARCH_RESULT_ITEM,
+                    polling=RESULTS_SETTLE_POLL_MS,
+                    timeout=RESULTS_SETTLE_TIMEOUT_MS,
+                ).json_value()
+            except PlaywrightTimeoutError:
+                continue
+            
+            # Results are settled and there is nothing further down to load, or enough are loaded
+            if state["bottom"] or (target and state["count"] >= target):
+                break
+            self.browser.humanizer.random_delay(500, 1500)
         
         # Scroll back to top
         self.browser.page.evaluate("window.scrollTo(0, 0)")
@@ -3,15 +3,23 @@ Configuration management for LinkedIn Automation.
 """
 
 import os
+import pickle
 from pathlib import Path
 from typing import List, Optional
 from dataclasses import dataclass, field
 
-import yaml
-from dotenv import load_dotenv
+# Set once .env has been loaded; yaml and dotenv are imported on first use
+_dotenv_loaded = False
 
-# Load environment variables
-load_dotenv()
+
+def _load_dotenv() -> None:
+    """Load environment variables from .env the first time config is built."""
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+    _dotenv_loaded = True
 
 
 @dataclass
@@ -22,6 +30,7 @@ class LinkedInConfig:
     base_url: str = "https://www.linkedin.com"
 
     def __post_init__(self):
+        _load_dotenv()
         self.email = self.email or os.getenv('LINKEDIN_EMAIL', '')
         self.password = self.password or os.getenv('LINKEDIN_PASSWORD', '')
 
@@ -34,6 +43,14 @@ class BrowserConfig:
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     viewport_width: int = 1920
     viewport_height: int = 1080
+    # Request types aborted before they hit the network (Playwright resource types)
+    block_resource_types: List[str] = field(default_factory=lambda: ["image", "media", "font"])
+    # Regex patterns of URLs (e.g. trackers) aborted regardless of type
+    blocked_url_patterns: List[str] = field(default_factory=list)
+    # Attach to an already running Chrome (e.g. "http://localhost:9222") instead of launching one
+    cdp_endpoint: Optional[str] = None
+    # Replace the main page with a fresh one after this many actions (0 disables) to shed leaked DOM/JS heap
+    max_actions_per_page: int = 200
 
 
 @dataclass
@@ -44,6 +61,9 @@ class RateLimitConfig:
     min_delay_seconds: float = 2.0
     max_delay_seconds: float = 5.0
     page_load_delay_seconds: float = 3.0
+    parallel_senders: int = 1  # browser workers used when sending requests and follow-ups
+    connections_per_minute: float = 4.0
+    messages_per_minute: float = 6.0
 
 
 @dataclass
@@ -91,6 +111,7 @@ class DatabaseConfig:
         if isinstance(self.port, str) and self.port.isdigit():
             self.port = int(self.port)
             
+        _load_dotenv()
         self.host = self.host or os.getenv('DB_POSTGRESDB_HOST', '')
         self.port = self.port or int(os.getenv('DB_POSTGRESDB_PORT', '5432'))
         self.database = self.database or os.getenv('DB_POSTGRESDB_DATABASE', '')
@@ -122,6 +143,42 @@ class Config:
         Path(self.paths.tracking_dir).mkdir(parents=True, exist_ok=True)
 
 
+def _read_config_data(config_path: str) -> dict:
+    """
+    Parse the YAML config file, reusing a pickled copy of the parsed data.
+    
+    The pickle (<config_path>.pkl) stores the YAML file's mtime and is only
+    used while that still matches. Only the raw dict is cached; Config objects
+    are rebuilt on every load so environment variables are always re-read.
+    """
+    cache_path = Path(f"{config_path}.pkl")
+    mtime = Path(config_path).stat().st_mtime_ns
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_mtime, config_data = pickle.load(f)
+        if cached_mtime == mtime:
+            return config_data
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+    
+    import yaml
+    
+    with open(config_path, 'r') as f:
+        config_data = yaml.safe_load(f) or {}
+    
+    try:
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((mtime, config_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Caching is best-effort (e.g. read-only config directory)
+        pass
+    
+    return config_data
+
+
 def load_config(config_path: Optional[str] = None) -> Config:
     """
     Load configuration from YAML file and environment variables.
@@ -132,11 +189,11 @@ def load_config(config_path: Optional[str] = None) -> Config:
     Returns:
         Config object with all settings.
     """
+    _load_dotenv()
     config_data = {}
     
     if config_path and Path(config_path).exists():
-        with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f) or {}
+        config_data = _read_config_data(config_path)
     
     # Manually construct nested dataclasses from dict
     # This was automatic in Pydantic, but needs manual mapping in dataclasses
@@ -16,7 +16,7 @@ class ConnectionStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
     """LinkedIn user profile."""
     url: str
@@ -28,21 +28,43 @@ class Profile:
     location: str = ""
     title: str = ""
     scraped_at: datetime = field(default_factory=datetime.now)
+    # Memoised get_template_vars() result; slots rule out functools.cached_property
+    _template_vars: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @classmethod
+    def hydrate_from_row(cls, row: Dict[str, Any]) -> "Profile":
+        """Build a Profile from a DB row dict, ignoring NULLs and columns with no matching field."""
+        data = {}
+        for column, value in row.items():
+            name = "url" if column == "linkedin_url" else column
+            model_field = cls.__dataclass_fields__.get(name)
+            if value is not None and model_field is not None and model_field.init:
+                data[name] = value
+        return cls(**data)
     
     def get_template_vars(self) -> Dict[str, str]:
-        """Get variables for template substitution."""
-        return {
-            "first_name": self.first_name or (self.name.split()[0] if self.name else ""),
-            "last_name": self.last_name or (self.name.split()[-1] if len(self.name.split()) > 1 else ""),
+        """
+        Get variables for template substitution.
+        
+        Computed on first call and cached, as profiles are not modified after
+        scraping. Callers must not mutate the returned dict.
+        """
+        if self._template_vars is not None:
+            return self._template_vars
+        parts = self.name.split()
+        self._template_vars = {
+            "first_name": self.first_name or (parts[0] if parts else ""),
+            "last_name": self.last_name or (parts[-1] if len(parts) > 1 else ""),
             "name": self.name,
             "company": self.company,
             "title": self.title,
             "location": self.location,
             "headline": self.headline,
         }
+        return self._template_vars
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionRequest:
     """A connection request sent to a profile."""
     profile_url: str
@@ -53,7 +75,7 @@ class ConnectionRequest:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A message sent to a connection."""
     recipient_url: str
@@ -64,7 +86,7 @@ class Message:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchCriteria:
     """Search criteria for finding profiles."""
     keywords: str = ""
@@ -78,7 +100,7 @@ class SearchCriteria:
     max_results: int = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Result of a profile search."""
     criteria: SearchCriteria
@@ -89,7 +111,7 @@ class SearchResult:
     duration_seconds: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Cookie:
     """Browser cookie."""
     name: str
@@ -101,7 +123,7 @@ class Cookie:
     http_only: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Browser session with cookies."""
     email: str
@@ -111,7 +133,7 @@ class Session:
     valid: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyStats:
     """Daily usage statistics."""
     date: str
@@ -122,7 +144,7 @@ class DailyStats:
     errors: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionLog:
     """Log entry for an automation action."""
     action: str
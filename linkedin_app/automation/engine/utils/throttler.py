@@ -0,0 +1,101 @@
+"""
+Adaptive rate limiting for outbound LinkedIn actions.
+"""
+
+import random
+import threading
+import time
+from typing import Optional, Tuple
+
+from loguru import logger
+
+
+# Error fragments that indicate LinkedIn is throttling or challenging the session
+RATE_LIMIT_MARKERS = (
+    "429",
+    "too many",
+    "rate limit",
+    "challenge",
+    "checkpoint",
+    "unusual activity",
+)
+
+
+class AdaptiveThrottler:
+    """
+    Token bucket that paces actions to a target rate.
+
+    acquire() only blocks as long as needed for the next token. penalize()
+    halves the refill rate for a cool-down window; once it expires the rate
+    recovers additively towards the configured rate (AIMD). A random
+    jitter of jitter_seconds (min, max) is added after every token so sends
+    never land on an exact, machine-like interval.
+    """
+
+    def __init__(
+        self,
+        rate_per_min: float,
+        burst: int = 1,
+        penalty_minutes: float = 10.0,
+        min_rate_per_min: float = 0.5,
+        jitter_seconds: Tuple[float, float] = (0.0, 0.0),
+    ):
+        self.base_rate = rate_per_min / 60.0
+        self.min_rate = min(min_rate_per_min, rate_per_min) / 60.0
+        self.rate = self.base_rate
+        self.capacity = max(1, burst)
+        self.penalty_seconds = penalty_minutes * 60.0
+        self.jitter_seconds = jitter_seconds
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._penalty_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update and recover the rate after a penalty."""
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rate < self.base_rate and now >= self._penalty_until:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * 0.1)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def acquire(self) -> float:
+        """Block until a token is available, plus the random jitter. Returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+        
+        jitter = random.uniform(*self.jitter_seconds)
+        if jitter > 0:
+            time.sleep(jitter)
+        return waited + jitter
+
+    def penalize(self) -> None:
+        """Halve the refill rate and drain the bucket for the cool-down window."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            self._penalty_until = now + self.penalty_seconds
+        logger.warning(f"Rate limit suspected, slowing down to {self.rate * 60:.2f} actions/min")
+
+    def observe(self, error: Optional[str]) -> bool:
+        """Penalize if the given error looks like a rate limit. Returns True when penalized."""
+        if error and is_rate_limited(error):
+            self.penalize()
+            return True
+        return False
+
+
+def is_rate_limited(error: str) -> bool:
+    """Check whether an error message looks like a 429 or a security challenge."""
+    err = error.lower()
+    return any(marker in err for marker in RATE_LIMIT_MARKERS)
@@ -0,0 +1,54 @@
+"""
+Start a long-lived Chrome that bot jobs attach to over CDP.
+"""
+
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from automation.engine.browser.antidetect import AntiDetect
+
+
+class Command(BaseCommand):
+    help = "Launch Chrome with remote debugging so jobs can attach via browser.cdp_endpoint"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--port', type=int, default=9222)
+        parser.add_argument(
+            '--user-data-dir',
+            default=str(settings.BASE_DIR / "data" / "chrome-profile"),
+            help="Profile directory; keeps the LinkedIn session between launches",
+        )
+        parser.add_argument('--executable', help="Chrome binary (defaults to Playwright's Chromium)")
+        parser.add_argument('--headless', action='store_true')
+
+    def handle(self, *args, **options):
+        executable = options['executable'] or self._playwright_chromium()
+        command = [
+            executable,
+            f"--remote-debugging-port={options['port']}",
+            f"--user-data-dir={options['user_data_dir']}",
+            *AntiDetect().get_launch_args(),
+        ]
+        if options['headless']:
+            command.append("--headless=new")
+
+        # Detach so Chrome outlives this command
+        if sys.platform == "win32":
+            detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            detach = {"start_new_session": True}
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **detach)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Chrome started (pid {process.pid}). Set browser.cdp_endpoint to "
+            f"\"http://localhost:{options['port']}\" in config.yaml"
+        ))
+
+    @staticmethod
+    def _playwright_chromium() -> str:
+        from playwright.sync_api import sync_playwright
+        with sync_playwright() as playwright:
+            return playwright.chromium.executable_path
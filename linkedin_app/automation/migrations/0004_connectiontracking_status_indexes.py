@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-16 15:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automation', '0003_alter_logentry_options_alter_linkedinprofile_table'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='connectiontracking',
+            name='automation__profile_7cd4ef_idx',
+        ),
+        migrations.AddIndex(
+            model_name='connectiontracking',
+            index=models.Index(fields=['profile_url', 'status'], name='automation__profile_b5c202_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='connectiontracking',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['profile_url'], name='ct_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 15:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automation', '0004_connectiontracking_status_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='logentry',
+            index=models.Index(fields=['job', 'id'], name='automation__job_id_b2d14a_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 15:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automation', '0005_logentry_job_id_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-created_at'], name='automation__created_ecd8f2_idx'),
+        ),
+    ]
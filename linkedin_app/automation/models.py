@@ -18,6 +18,12 @@ class Job(models.Model):
     started_at = models.DateTimeField(null=True, blank=True)
     finished_at = models.DateTimeField(null=True, blank=True)
     
+    class Meta:
+        indexes = [
+            # Recent-jobs list and the log poller's latest-job lookup read newest first
+            models.Index(fields=['-created_at']),
+        ]
+    
     def __str__(self):
         return f"{self.command} ({self.status}) - {self.created_at}"
 
@@ -30,6 +36,10 @@ class LogEntry(models.Model):
 
     class Meta:
         ordering = ['timestamp']
+        indexes = [
+            # Serves the log poller's "lines of this job after the last id seen" query
+            models.Index(fields=['job', 'id']),
+        ]
 
 class LinkedInProfile(models.Model):
     """Stores scraped LinkedIn profile data (Matches linkedin_db_network_data)."""
@@ -82,7 +92,9 @@ class ConnectionTracking(models.Model):
 
     class Meta:
         indexes = [
-            models.Index(fields=['profile_url']),
+            # Covers the "already sent to this profile?" check as well as plain URL lookups
+            models.Index(fields=['profile_url', 'status']),
+            models.Index(fields=['profile_url'], condition=models.Q(status='pending'), name='ct_pending_idx'),
             models.Index(fields=['sent_at']),
         ]
 
@@ -1,117 +1,442 @@
+import atexit
+import copy
+import logging
+import queue
 import sys
 import threading
+import time
 import traceback
+from concurrent.futures import Future
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from logging.handlers import QueueListener
 from pathlib import Path
+from typing import Optional
 from loguru import logger
+from psycopg2.extras import execute_values
 from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
 from .models import Job, LogEntry
 
+# Log records buffered before they are written, and the longest they may wait
+LOG_FLUSH_SIZE = 100
+LOG_FLUSH_INTERVAL_SECONDS = 1.0
+# Records waiting for the writer thread; beyond this new records are dropped
+LOG_QUEUE_SIZE = 10000
+
+# Longest a critical-error insert may block, and where it goes if the database is unusable
+CRITICAL_WRITE_TIMEOUT_MS = 5000
+CRITICAL_LOG_DIR = settings.BASE_DIR / "logs"
+
+# Multi-row insert used by the log writer, bypassing model construction
+LOG_INSERT_SQL = f"INSERT INTO {LogEntry._meta.db_table} (job_id, level, message, timestamp) VALUES %s"
+
+
+class LogEntryBatchHandler(logging.Handler):
+    """
+    Handler that stores job log records as LogEntry rows.
+    
+    Records are buffered as plain tuples and written with one multi-row INSERT
+    once LOG_FLUSH_SIZE have accumulated or LOG_FLUSH_INTERVAL_SECONDS have
+    passed since the last write. No model instances are built on this path.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._buffer = []
+        self._last_flush = time.monotonic()
+
+    def emit(self, record):
+        self._buffer.append((record.job_id, record.levelname, record.getMessage(), record.log_time))
+        if (
+            len(self._buffer) >= LOG_FLUSH_SIZE
+            or time.monotonic() - self._last_flush > LOG_FLUSH_INTERVAL_SECONDS
+        ):
+            self.flush()
+
+    def flush(self):
+        """Write all buffered records in one bulk insert."""
+        self.acquire()
+        try:
+            batch, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+            if batch:
+                with connection.cursor() as cursor:
+                    execute_values(cursor.cursor, LOG_INSERT_SQL, batch, page_size=500)
+        except Exception as e:
+            print(f"SINK ERROR: {e}", file=sys.stderr)
+            # Drop this thread's connection so the next flush reconnects if it went stale
+            connection.close()
+        finally:
+            self.release()
+
+
+class _TimedQueueListener(QueueListener):
+    """
+    QueueListener that also flushes its handlers when the queue stays empty
+    for LOG_FLUSH_INTERVAL_SECONDS, so the last lines before a long wait
+    (breaks, throttling, idle waits) still reach the database promptly.
+    """
+
+    def dequeue(self, block):
+        while True:
+            try:
+                return self.queue.get(block, timeout=LOG_FLUSH_INTERVAL_SECONDS)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+
+# Job logs are handed to one writer thread through a bounded queue, so the bot
+# never waits on the database and a slow database cannot grow memory unbounded
+_log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+_log_handler = LogEntryBatchHandler()
+_log_listener = _TimedQueueListener(_log_queue, _log_handler)
+_log_listener.start()
+
+
+@atexit.register
+def _stop_log_listener():
+    _log_listener.stop()
+    _log_handler.flush()
+
+
+def make_job_log_sink(job_id: int):
+    """Build a loguru sink that queues records for the job's LogEntry rows."""
+    def sink(message):
+        try:
+            record = message.record
+            # Format log message with optional exception info
+            log_message = record["message"]
+            if record.get("exception"):
+                type_, value, tb = record["exception"]
+                log_message += "\n" + "".join(traceback.format_exception(type_, value, tb))
+
+            _log_queue.put_nowait(logging.makeLogRecord({
+                "job_id": job_id,
+                "levelname": record["level"].name,
+                "msg": log_message,
+                "log_time": record["time"],
+            }))
+        except queue.Full:
+            print(f"SINK ERROR: log queue full, dropping record for job {job_id}", file=sys.stderr)
+        except Exception as e:
+            print(f"SINK ERROR: {e}", file=sys.stderr)
+
+    return sink
+
+
+def _record_critical(job_id: int, error_msg: str) -> None:
+    """
+    Store a job's critical error, falling back to a local file.
+    
+    The failure may be the database itself, so the insert runs under a short
+    statement timeout and any error sends the record to
+    CRITICAL_LOG_DIR/critical_job_<id>.log instead of hanging or losing it.
+    """
+    try:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"SET LOCAL statement_timeout = {CRITICAL_WRITE_TIMEOUT_MS}")
+            execute_values(cursor.cursor, LOG_INSERT_SQL, [(job_id, "CRITICAL", error_msg, timezone.now())])
+        return
+    except Exception as e:
+        print(f"SINK ERROR: {e}", file=sys.stderr)
+    
+    try:
+        CRITICAL_LOG_DIR.mkdir(parents=True, exist_ok=True)
+        with open(CRITICAL_LOG_DIR / f"critical_job_{job_id}.log", "a") as f:
+            f.write(f"{timezone.now().isoformat()} {error_msg}\n")
+    except OSError as e:
+        print(f"SINK ERROR: {e}", file=sys.stderr)
+
+
+def flush_job_logs():
+    """Wait for queued records to reach the writer and write its buffer."""
+    _log_queue.join()
+    _log_handler.flush()
+
+
+# Task parameters that arrive as form strings but must be integers
+INT_TASK_PARAMS = frozenset({'start_page', 'end_page', 'pages', 'max_connections'})
+# Levels a job's log can be captured at; records below it never reach the log queue
+JOB_LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+
+
+@dataclass
+class TaskParams:
+    """Job parameters from the dashboard form, validated once at submit time."""
+    keywords: str = ""
+    location: str = ""
+    sales_nav_url: str = ""
+    message: str = ""
+    start_page: int = 1
+    end_page: int = 1
+    pages: int = 1
+    max_connections: Optional[int] = None
+    log_level: str = "INFO"
+
+    @property
+    def limit(self) -> int:
+        """Per-run action limit; 10 when the form left it empty."""
+        return 10 if self.max_connections is None else self.max_connections
+
+    @classmethod
+    def from_dict(cls, params: dict) -> 'TaskParams':
+        """Build from form values, ignoring empty ones. Raises ValueError for a non-integer number."""
+        values = {}
+        for field_ in fields(cls):
+            value = params.get(field_.name)
+            if not value:
+                continue
+            if field_.name in INT_TASK_PARAMS:
+                try:
+                    value = int(value)
+                except ValueError:
+                    raise ValueError(f"Invalid value for {field_.name}: {value!r}") from None
+            values[field_.name] = value
+        
+        log_level = values.get('log_level', cls.log_level).upper()
+        if log_level not in JOB_LOG_LEVELS:
+            raise ValueError(f"Invalid value for log_level: {log_level!r}")
+        values['log_level'] = log_level
+        return cls(**values)
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime_ns: int):
+    """Load the bot config once per file version; mtime_ns keys out stale copies."""
+    from .engine.utils.config import load_config
+    return load_config(config_path)
+
+
+# Warmed-up bots idle longer than this are stopped instead of reused
+BOT_MAX_IDLE_SECONDS = 15 * 60
+# How often an idle job thread checks whether its pooled bot has expired
+BOT_REAP_INTERVAL_SECONDS = 60
+# Longest interpreter exit waits for each job thread to stop its bot
+BOT_SHUTDOWN_TIMEOUT_SECONDS = 30
+
+
+class BotPool:
+    """
+    Keeps a started, logged-in LinkedInBot around between jobs for reuse.
+    
+    Playwright's sync API is bound to the thread that started it, so a bot can
+    only be reused by the executor thread that created it: each worker thread
+    keeps at most one idle bot in thread-local storage rather than a shared
+    queue. A bot is reused only for the same config key; bots keyed by an older
+    config are stopped on their thread's next acquire, and reap() (run by the
+    idle job thread itself, see BotExecutor) stops those idle too long.
+    """
+
+    def __init__(self, max_idle_seconds: float = BOT_MAX_IDLE_SECONDS):
+        self.max_idle_seconds = max_idle_seconds
+        self._local = threading.local()
+
+    def acquire(self, config, config_key):
+        """Return (bot, warm); warm bots are already started and were logged in."""
+        idle = getattr(self._local, 'idle', None)
+        self._local.idle = None
+        if idle:
+            bot, key, released_at = idle
+            if key == config_key and time.monotonic() - released_at < self.max_idle_seconds:
+                logger.info("Reusing warm browser session from previous job")
+                return bot, True
+            self._stop(bot)
+
+        from .engine.main import LinkedInBot
+        return LinkedInBot(config), False
+
+    def release(self, bot, config_key, reusable: bool) -> None:
+        """Keep the bot for this thread's next job, or stop it if it should not be reused."""
+        if reusable:
+            self._local.idle = (bot, config_key, time.monotonic())
+        else:
+            self._stop(bot)
+
+    def reap(self, force: bool = False) -> None:
+        """Stop this thread's idle bot if it has been idle too long (or always, with force)."""
+        idle = getattr(self._local, 'idle', None)
+        if not idle:
+            return
+        bot, _, released_at = idle
+        if force or time.monotonic() - released_at >= self.max_idle_seconds:
+            self._local.idle = None
+            logger.info("Stopping idle browser session")
+            self._stop(bot)
+    
+    @staticmethod
+    def _stop(bot) -> None:
+        try:
+            bot.stop()
+        except Exception as e:
+            logger.error(f"Failed to stop bot: {e}")
+
+
+_bot_pool = BotPool()
+
+
+class BotExecutor:
+    """
+    Fixed set of job threads, each owning at most one pooled bot.
+    
+    Works like a ThreadPoolExecutor, except that a thread waiting for work
+    wakes every BOT_REAP_INTERVAL_SECONDS to stop its own expired bot: bots
+    can only be stopped from the thread that started them, so nothing else
+    can reap them. shutdown() makes every thread stop its bot, which also
+    flushes buffered daily stats and closes its DB pool.
+    """
+
+    def __init__(self, max_workers: int, pool: BotPool):
+        self._pool = pool
+        self._jobs = queue.Queue()
+        self._threads = [
+            threading.Thread(target=self._work, name=f'bot_{i}', daemon=True)
+            for i in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        self._jobs.put((future, fn, args))
+        return future
+
+    def _work(self) -> None:
+        while True:
+            try:
+                item = self._jobs.get(timeout=BOT_REAP_INTERVAL_SECONDS)
+            except queue.Empty:
+                self._pool.reap()
+                continue
+            if item is None:
+                self._pool.reap(force=True)
+                return
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def shutdown(self, timeout: float = BOT_SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """Stop the threads once their current job ends, stopping their idle bots."""
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+
+
+# Bounds how many bot jobs (and so browsers) run at once; the rest wait as PENDING
+AUTOMATION_EXECUTOR = BotExecutor(getattr(settings, 'AUTOMATION_MAX_WORKERS', 2), _bot_pool)
+# Registered after the log listener's hook, so it runs first and bots can still log
+atexit.register(AUTOMATION_EXECUTOR.shutdown)
+# Futures of submitted jobs that have not finished yet, by job id
+_job_futures = {}
+_job_futures_lock = threading.Lock()
+
+
 class AutomationService:
     @staticmethod
-    def run_automation_task(command: str, params: dict, job_id: int):
+    def submit(command: str, params: TaskParams, job_id: int) -> Future:
+        """Queue a job on the automation executor."""
+        future = AUTOMATION_EXECUTOR.submit(AutomationService.run_automation_task, command, params, job_id)
+        with _job_futures_lock:
+            _job_futures[job_id] = future
+
+        def forget(_):
+            with _job_futures_lock:
+                _job_futures.pop(job_id, None)
+
+        future.add_done_callback(forget)
+        return future
+
+    @staticmethod
+    def cancel(job_id: int) -> bool:
+        """Cancel a job that is still waiting for a worker. Returns False if it already started."""
+        with _job_futures_lock:
+            future = _job_futures.get(job_id)
+        if not future or not future.cancel():
+            return False
+        Job.objects.filter(id=job_id).update(status='STOPPED')
+        return True
+
+    @staticmethod
+    def run_automation_task(command: str, params: TaskParams, job_id: int):
         """Synchronous task wrapper for the automation bot."""
+        # Final status, written together with finished_at once the job ends
+        status = 'FAILED'
         try:
-            job = Job.objects.get(id=job_id)
-            job.status = 'RUNNING'
-            from django.utils import timezone
-            job.started_at = timezone.now()
-            job.save()
-
-            def filtered_sink(message):
-                try:
-                    record = message.record
-                    # Format log message with optional exception info
-                    log_message = record["message"]
-                    if record.get("exception"):
-                        type_, value, tb = record["exception"]
-                        log_message += "\n" + "".join(traceback.format_exception(type_, value, tb))
-
-                    LogEntry.objects.create(
-                        job_id=job_id,
-                        level=record["level"].name,
-                        message=log_message,
-                        timestamp=record["time"]
-                    )
-                except Exception as e:
-                    print(f"SINK ERROR: {e}", file=sys.stderr)
+            Job.objects.filter(id=job_id).update(status='RUNNING', started_at=timezone.now())
 
-            handler_id = logger.add(filtered_sink, level="DEBUG", format="{message}", enqueue=True)
+            handler_id = logger.add(make_job_log_sink(job_id), level=params.log_level, format="{message}")
             logger.info(f"Task started: {command}")
 
-            from .engine.main import LinkedInBot
-            from .engine.utils.config import load_config
-            
             config_path = settings.BASE_DIR / "configs" / "config.yaml"
             if not config_path.exists():
                 raise FileNotFoundError(f"Config file not found at {config_path}")
 
-            config = load_config(str(config_path))
+            # Deep copy so per-job overrides below never leak into the cached config
+            config_mtime = config_path.stat().st_mtime_ns
+            config = copy.deepcopy(_load_config_cached(str(config_path), config_mtime))
             
-            if params.get('max_connections'):
-                 config.rate_limits.daily_connection_limit = int(params['max_connections'])
+            if params.max_connections is not None:
+                 config.rate_limits.daily_connection_limit = params.max_connections
             
-            bot = LinkedInBot(config)
+            # Bots are built from the config, so only reuse one built from an identical one
+            config_key = (config_mtime, config.rate_limits.daily_connection_limit)
+            bot, warm = _bot_pool.acquire(config, config_key)
             
             try:
-                bot.start()
-                is_logged_in = bot.login()
-                if not is_logged_in:
-                    raise Exception("Failed to login to LinkedIn")
+                if not warm:
+                    bot.start()
+                if not (warm and bot.authenticator.is_logged_in()):
+                    is_logged_in = bot.login()
+                    if not is_logged_in:
+                        raise Exception("Failed to login to LinkedIn")
 
                 if command == "Scrapping":
                     bot.run_scrapping(
-                        keywords=params.get('keywords', ''),
-                        location=params.get('location', ''),
-                        start_page=int(params.get('start_page', 1)),
-                        pages=int(params.get('pages', 1)),
-                        limit=int(params.get('max_connections', 10))
+                        keywords=params.keywords,
+                        location=params.location,
+                        start_page=params.start_page,
+                        pages=params.pages,
+                        limit=params.limit
                     )
                 elif command == "Filtering":
-                    bot.run_filtering(int(params.get('max_connections', 10)))
+                    bot.run_filtering(params.limit)
                 elif command == "Send_Requests":
-                    bot.run_sending(int(params.get('max_connections', 10)))
+                    bot.run_sending(params.limit)
                 elif command == "SalesNavigator_Connect":
                     bot.run_sales_nav_connection(
-                        url=params.get('sales_nav_url', ''),
-                        start_page=int(params.get('start_page', 1)),
-                        end_page=int(params.get('end_page', 1)),
-                        limit=int(params.get('max_connections', 10)),
-                        message=params.get('message', '')
+                        url=params.sales_nav_url,
+                        start_page=params.start_page,
+                        end_page=params.end_page,
+                        limit=params.limit,
+                        message=params.message
                     )
                 elif command == "dry_run":
-                    import time
                     logger.info("Executing Dry Run - Configuration Valid")
                     time.sleep(2)
                 
-                job.status = 'COMPLETED'
+                status = 'COMPLETED'
             except Exception:
                 logger.exception("Job logic failed")
-                job.status = 'FAILED'
             finally:
-                if bot:
-                    bot.stop()
+                # Keep the session warm for the next job unless this one went wrong
+                _bot_pool.release(bot, config_key, reusable=status == 'COMPLETED')
                 logger.remove(handler_id)
+                flush_job_logs()
         except Exception as e:
             error_msg = f"Critical job error: {e}\n{traceback.format_exc()}"
             print(error_msg, file=sys.stderr)
-            try:
-                job = Job.objects.get(id=job_id)
-                job.status = 'FAILED'
-                job.save()
-                # Log the critical error to LogEntry as well
-                LogEntry.objects.create(
-                    job_id=job_id,
-                    level="CRITICAL",
-                    message=error_msg,
-                )
-            except:
-                pass
+            # Log the critical error to LogEntry as well
+            _record_critical(job_id, error_msg)
         finally:
             try:
-                job = Job.objects.get(id=job_id)
-                from django.utils import timezone
-                job.finished_at = timezone.now()
-                job.save()
+                Job.objects.filter(id=job_id).update(status=status, finished_at=timezone.now())
             except:
                 pass
 
@@ -1,17 +1,21 @@
 from django.shortcuts import render, redirect
 from django.http import HttpResponse
+from django.utils.html import escape
 from .models import Job, LogEntry, LinkedInProfile, DailyStats
 from django.db.models import Sum
-from .services import AutomationService
+from .services import AutomationService, TaskParams
+
+# Most log lines returned by one poll of get_logs
+LOG_PAGE_SIZE = 500
 
 def dashboard(request):
     """Render the main dashboard."""
-    recent_jobs = Job.objects.order_by('-created_at')[:5]
+    recent_jobs = Job.objects.only('command', 'status', 'created_at').order_by('-created_at')[:5]
     
     # Fetch today's stats from DailyStats model
     from django.utils import timezone
     today = timezone.now().date()
-    stats_today = DailyStats.objects.filter(date=today).first()
+    stats_today = DailyStats.objects.filter(date=today).only('connections_sent', 'messages_sent', 'errors').first()
     
     total_profiles = LinkedInProfile.objects.count()
     
@@ -35,6 +39,15 @@ def start_task(request):
     # Filter out empty values and csrf token
     params = {k: v for k, v in request.POST.items() if v and k != 'csrfmiddlewaretoken'}
     
+    # Reject bad numbers now rather than after the bot has started a browser
+    try:
+        task_params = TaskParams.from_dict(params)
+    except ValueError as e:
+        if request.headers.get('HX-Request'):
+            # htmx only swaps successful responses, so show the error inline
+            return HttpResponse(f'<div class="text-red-500">{escape(e)}</div>')
+        return HttpResponse(escape(e), status=400)
+    
     # Create job entry
     from django.utils import timezone
     job = Job.objects.create(
@@ -44,41 +57,61 @@ def start_task(request):
         created_at=timezone.now()
     )
     
-    # Run in a background thread to avoid blocking the response
-    import threading
-    thread = threading.Thread(
-        target=AutomationService.run_automation_task,
-        args=(command, params, job.id),
-        daemon=True
-    )
-    thread.start()
+    # Run on the bounded job pool to avoid blocking the response
+    future = AutomationService.submit(command, task_params, job.id)
     
     if request.headers.get('HX-Request'):
-        return HttpResponse(f'<div class="text-blue-500">Job {command} started (ID: {job.id})</div>')
+        state = 'started' if future.running() else 'queued'
+        return HttpResponse(f'<div class="text-blue-500">Job {command} {state} (ID: {job.id})</div>')
     
     return redirect('dashboard')
 
 def get_logs(request):
-    """Get logs for the latest running job or a specific job."""
-    # Log polling can remain sync, reading from DB is fast enough
+    """
+    Get logs for the latest running job or a specific job.
+    
+    The poller sends back the last log id it rendered ('since') and the job it
+    is showing ('shown_job'), so each poll only fetches new lines. When the job
+    changes, or on the first poll, the newest lines replace the window instead.
+    """
     job_id = request.GET.get('job_id')
     
-    if job_id:
-        logs = LogEntry.objects.filter(job_id=job_id)
-    else:
-        latest_job = Job.objects.order_by('-created_at').first()
-        if latest_job:
-            logs = LogEntry.objects.filter(job_id=latest_job.id)
-        else:
-            logs = []
-            
-    context = {'logs': logs}
-    return render(request, 'automation/partials/log_lines.html', context)
+    if not job_id:
+        job_id = Job.objects.order_by('-created_at').values_list('id', flat=True).first()
+    job_id = str(job_id) if job_id else ''
+    
+    since = request.GET.get('since', '')
+    since = int(since) if since.isdigit() else 0
+    if request.GET.get('shown_job') != job_id:
+        since = 0
+    
+    logs = []
+    if job_id and since:
+        logs = list(LogEntry.objects.filter(job_id=job_id, id__gt=since).order_by('id')[:LOG_PAGE_SIZE])
+    elif job_id:
+        logs = list(LogEntry.objects.filter(job_id=job_id).order_by('-id')[:LOG_PAGE_SIZE])[::-1]
+    
+    context = {
+        'logs': logs,
+        'since': since,
+        'cursor': logs[-1].id if logs else since,
+        'job_id': job_id,
+    }
+    response = render(request, 'automation/partials/log_lines.html', context)
+    if not since:
+        response['HX-Reswap'] = 'innerHTML'
+    return response
 
 def profiles_view(request):
     """Render the profiles list page."""
-    profiles = LinkedInProfile.objects.all().order_by('-scraped_at')
+    # Only the columns the table renders; skips the raw activity text and timestamps
+    profiles = LinkedInProfile.objects.only(
+        'linkedin_url', 'name', 'location', 'scrape_status', 'request_status', 'scraped_at'
+    ).order_by('-scraped_at')
     return render(request, 'automation/profiles.html', {'profiles': profiles})
 
 def stop_task(request, job_id):
-    return HttpResponse("Stop not implemented yet")
+    """Cancel a queued job; jobs that are already running cannot be stopped yet."""
+    if AutomationService.cancel(job_id):
+        return HttpResponse(f"Job {job_id} cancelled")
+    return HttpResponse("Stop not implemented yet for running jobs")
@@ -121,3 +121,9 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
+
+
+# Automation jobs
+
+# Jobs run concurrently, each with its own browser; further jobs wait in the queue
+AUTOMATION_MAX_WORKERS = 2